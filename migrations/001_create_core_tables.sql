@@ -0,0 +1,22 @@
+CREATE TABLE IF NOT EXISTS event_managers
+(
+    event_manager_id UUID,
+    mode             String,
+    status           String,
+    created_at       DateTime DEFAULT now()
+)
+ENGINE = MergeTree
+ORDER BY event_manager_id;
+
+CREATE TABLE IF NOT EXISTS events
+(
+    event_id         UUID,
+    event_manager_id UUID,
+    event_type       String,
+    priority         String,
+    payload          String,
+    created_at       DateTime DEFAULT now(),
+    executed_at      Nullable(DateTime)
+)
+ENGINE = MergeTree
+ORDER BY (event_manager_id, created_at);
@@ -0,0 +1,45 @@
+CREATE TABLE IF NOT EXISTS portfolios
+(
+    portfolio_id UUID,
+    name         String,
+    exchange     String,
+    balance      Decimal(18, 8),
+    currency     String,
+    created_at   DateTime DEFAULT now()
+)
+ENGINE = MergeTree
+ORDER BY portfolio_id;
+
+CREATE TABLE IF NOT EXISTS risk_controllers
+(
+    risk_controller_id UUID,
+    name               String,
+    max_loss           Decimal(18, 8),
+    max_orders         UInt32,
+    settings           Map(String, String),
+    created_at         DateTime DEFAULT now()
+)
+ENGINE = MergeTree
+ORDER BY risk_controller_id;
+
+CREATE TABLE IF NOT EXISTS orders
+(
+    order_id          UUID,
+    parent_order_id   Nullable(UUID),
+    portfolio_id      UUID,
+    strategy_id       Nullable(UUID),
+    exchange          String,
+    symbol            String,
+    order_type        String,
+    order_side        String,
+    order_status      String,
+    target_price      Decimal(18, 8),
+    initial_quantity  Decimal(18, 8),
+    executed_quantity Decimal(18, 8),
+    total_fee         Decimal(18, 8),
+    extra_summary     String,
+    created_at        DateTime DEFAULT now(),
+    updated_at        DateTime DEFAULT now()
+)
+ENGINE = MergeTree
+ORDER BY (portfolio_id, created_at);
@@ -0,0 +1,21 @@
+CREATE TABLE IF NOT EXISTS strategies
+(
+    strategy_id UUID,
+    name        String,
+    status      String,
+    settings    String,
+    created_at  DateTime DEFAULT now()
+)
+ENGINE = MergeTree
+ORDER BY strategy_id;
+
+CREATE TABLE IF NOT EXISTS strategy_subscriptions
+(
+    subscription_id  UUID,
+    strategy_id      UUID,
+    event_manager_id UUID,
+    portfolio_id     UUID,
+    created_at       DateTime DEFAULT now()
+)
+ENGINE = MergeTree
+ORDER BY subscription_id;
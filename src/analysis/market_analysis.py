@@ -0,0 +1,369 @@
+import threading
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
+
+from src.utils._njit import NUMBA_AVAILABLE, njit
+
+
+@njit(fastmath=True, cache=True)
+def _ema_kernel(x, alpha):
+    """Scalar EMA recurrence compiled with fastmath.
+
+    fastmath lets LLVM reassociate the y[n] = alpha*x[n] + (1-alpha)*y[n-1]
+    chain into FMAs; the loop carries no Python objects at all.
+    """
+    out = np.empty(x.shape[0])
+    beta = 1.0 - alpha
+    y = x[0]
+    out[0] = y
+    for i in range(1, x.shape[0]):
+        y = alpha * x[i] + beta * y
+        out[i] = y
+    return out
+
+
+def _ema(x, span):
+    """adjust=False EMA over a numpy array.
+
+    ewm(span=...).mean() rebuilds pandas window machinery per call; the
+    recurrence is one compiled kernel pass when numba is installed, and
+    an lfilter IIR evaluation otherwise.
+    """
+    alpha = 2.0 / (span + 1.0)
+    if NUMBA_AVAILABLE:
+        return _ema_kernel(np.ascontiguousarray(x, dtype=np.float64), alpha)
+    y, _ = lfilter([alpha], [1.0, alpha - 1.0], x, zi=[x[0] * (1.0 - alpha)])
+    return y
+
+
+def _terminal_ema(x, span):
+    """Last EMA value as one dot product with precomputed decay weights.
+
+    The recurrence is serial, but the terminal value is just a weighted
+    sum of the inputs — one BLAS dot instead of filtering the whole
+    series when only a live snapshot is needed.
+    """
+    alpha = 2.0 / (span + 1.0)
+    w = (1.0 - alpha) ** np.arange(x.shape[0] - 1, -1, -1, dtype=np.float64)
+    w[1:] *= alpha
+    return float(np.dot(w, x))
+
+
+@njit(cache=True)
+def _rsi_wilder(close, period):
+    """Closed-form Wilder RSI in one pass over a float64 array.
+
+    The rolling-mean formulation allocates several intermediate Series;
+    this loop keeps only the two running averages and compiles to native
+    code when numba is available.
+    """
+    n = close.shape[0]
+    out = np.empty(n)
+    out[:] = np.nan
+    if n <= period:
+        return out
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = close[i] - close[i - 1]
+        if change > 0.0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= period
+    avg_loss /= period
+    for i in range(period, n):
+        if i > period:
+            change = close[i] - close[i - 1]
+            gain = change if change > 0.0 else 0.0
+            loss = -change if change < 0.0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss == 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+@njit(cache=True)
+def _fused_indicators(high, low, close, volume, k_period, aroon_period):
+    """Aroon, stochastic %K and OBV in one pass over the OHLCV arrays.
+
+    Computing these separately walks high/low/close/volume once per
+    indicator; fusing them keeps each element hot in cache while every
+    consumer reads it. Rolling extrema use monotonic index deques
+    (amortised O(1) per step), popping on strict inequality so ties
+    resolve to the earliest index like np.argmax.
+    """
+    n = close.shape[0]
+    aroon_up = np.full(n, np.nan)
+    aroon_down = np.full(n, np.nan)
+    k_vals = np.full(n, np.nan)
+    obv = np.empty(n)
+
+    dq_hi_k = np.empty(n, np.int64)
+    dq_lo_k = np.empty(n, np.int64)
+    dq_hi_a = np.empty(n, np.int64)
+    dq_lo_a = np.empty(n, np.int64)
+    hk_head = hk_tail = 0
+    lk_head = lk_tail = 0
+    ha_head = ha_tail = 0
+    la_head = la_tail = 0
+
+    run_obv = 0.0
+    for i in range(n):
+        if i > 0:
+            d = close[i] - close[i - 1]
+            if d > 0.0:
+                run_obv += volume[i]
+            elif d < 0.0:
+                run_obv -= volume[i]
+        obv[i] = run_obv
+
+        while hk_tail > hk_head and high[dq_hi_k[hk_tail - 1]] < high[i]:
+            hk_tail -= 1
+        dq_hi_k[hk_tail] = i
+        hk_tail += 1
+        if dq_hi_k[hk_head] <= i - k_period:
+            hk_head += 1
+
+        while lk_tail > lk_head and low[dq_lo_k[lk_tail - 1]] > low[i]:
+            lk_tail -= 1
+        dq_lo_k[lk_tail] = i
+        lk_tail += 1
+        if dq_lo_k[lk_head] <= i - k_period:
+            lk_head += 1
+
+        if i >= k_period - 1:
+            hi_v = high[dq_hi_k[hk_head]]
+            lo_v = low[dq_lo_k[lk_head]]
+            denom = hi_v - lo_v
+            if denom != 0.0:
+                k_vals[i] = 100.0 * (close[i] - lo_v) / denom
+
+        while ha_tail > ha_head and high[dq_hi_a[ha_tail - 1]] < high[i]:
+            ha_tail -= 1
+        dq_hi_a[ha_tail] = i
+        ha_tail += 1
+        if dq_hi_a[ha_head] <= i - aroon_period:
+            ha_head += 1
+
+        while la_tail > la_head and low[dq_lo_a[la_tail - 1]] > low[i]:
+            la_tail -= 1
+        dq_lo_a[la_tail] = i
+        la_tail += 1
+        if dq_lo_a[la_head] <= i - aroon_period:
+            la_head += 1
+
+        if i >= aroon_period - 1:
+            start = i - aroon_period + 1
+            aroon_up[i] = ((dq_hi_a[ha_head] - start)
+                           / (aroon_period - 1) * 100.0)
+            aroon_down[i] = ((dq_lo_a[la_head] - start)
+                             / (aroon_period - 1) * 100.0)
+
+    return aroon_up, aroon_down, k_vals, obv
+
+
+class MarketAnalysis:
+    """Technical indicators over one symbol's OHLCV frame.
+
+    Call :meth:`get_ohlcv` with a fresh frame from the data provider,
+    then query indicators; each indicator returns pandas Series aligned
+    to the frame index.
+
+    Readers never take a lock: :meth:`get_ohlcv` publishes an immutable
+    ``(index, arrays)`` snapshot with one atomic attribute store, and
+    each indicator grabs the whole snapshot once before computing, so
+    concurrent indicator calls scale across threads while a refresh can
+    land mid-flight without tearing anyone's view.
+    """
+
+    # One instance per (exchange, symbol): a global singleton made every
+    # pair share state, so parallel per-symbol analysis silently
+    # serialised. The cache keeps construction idempotent per key while
+    # distinct symbols get distinct state.
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __new__(cls, exchange, symbol):
+        key = (id(exchange), symbol)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                cls._instances[key] = instance
+        return instance
+
+    def __init__(self, exchange, symbol):
+        if getattr(self, "_initialised", False):
+            return
+        self.exchange = exchange
+        self.symbol = symbol
+        self.df = None
+        self._snapshot = None
+        self._initialised = True
+
+    def get_ohlcv(self, df):
+        """Install a fresh OHLCV frame as the basis for indicator calls.
+
+        Columns are materialised once as contiguous float32 arrays
+        (structure-of-arrays): indicators read plain numpy instead of
+        going through the Block manager per call, and float32 halves the
+        bytes streamed per pass — ample for %-scale indicators on prices
+        with 5-6 significant digits. Running sums upcast to float64 at
+        the accumulator to avoid drift.
+        """
+        arrays = {
+            c: np.ascontiguousarray(df[c].to_numpy(), dtype=np.float32)
+            for c in ("open", "high", "low", "close", "volume")
+        }
+        self.df = df
+        # Single attribute store: atomic under CPython, no reader lock.
+        self._snapshot = (df.index, arrays)
+        return df
+
+    def get_aroon(self, period=14):
+        """Aroon up/down via strided argmax/argmin over the raw arrays.
+
+        rolling().apply(lambda x: x.argmax()) pays a Python callback per
+        window; sliding_window_view reduces the whole series with one
+        vectorized argmax/argmin pass instead.
+        """
+        index, arrays = self._snapshot
+        high = arrays["high"]
+        low = arrays["low"]
+        idx_h = sliding_window_view(high, period).argmax(axis=1)
+        idx_l = sliding_window_view(low, period).argmin(axis=1)
+        pad = np.full(period - 1, np.nan)
+        aroon_up = pd.Series(
+            np.concatenate([pad, idx_h / (period - 1) * 100.0]), index=index
+        )
+        aroon_down = pd.Series(
+            np.concatenate([pad, idx_l / (period - 1) * 100.0]), index=index
+        )
+        logger.debug("Aroon calculation completed for {}", self.symbol)
+        return aroon_up, aroon_down
+
+    def get_rsi(self, period=14):
+        index, arrays = self._snapshot
+        rsi = pd.Series(_rsi_wilder(arrays["close"], period), index=index)
+        logger.debug("RSI calculation completed for {}", self.symbol)
+        return rsi
+
+    def get_ema(self, period=9, last_only=False):
+        """EMA of close; with last_only, just the terminal value as float."""
+        index, arrays = self._snapshot
+        close = arrays["close"]
+        if last_only:
+            ema = _terminal_ema(close, period)
+        else:
+            ema = pd.Series(_ema(close, period), index=index)
+        logger.debug("EMA calculation completed for {}", self.symbol)
+        return ema
+
+    def get_macd(self, fast_period=12, slow_period=26, signal_period=9):
+        index, arrays = self._snapshot
+        close = arrays["close"]
+        macd_line = _ema(close, fast_period) - _ema(close, slow_period)
+        macd = pd.Series(macd_line, index=index)
+        signal = pd.Series(_ema(macd_line, signal_period), index=index)
+        logger.debug("MACD calculation completed for {}", self.symbol)
+        return macd, signal
+
+    def get_bollinger_bands(self, period=20, num_std=2):
+        index, arrays = self._snapshot
+        x = arrays["close"]
+        # One pass over close: rolling sums of x and x*x give both the
+        # mean and the (ddof=1, matching rolling().std()) deviation.
+        s = np.concatenate(([0.0], np.cumsum(x, dtype=np.float64)))
+        s2 = np.concatenate(([0.0], np.cumsum(np.square(x, dtype=np.float64))))
+        win_sum = s[period:] - s[:-period]
+        win_sumsq = s2[period:] - s2[:-period]
+        mean = win_sum / period
+        var = (win_sumsq - period * mean * mean) / (period - 1)
+        std = np.sqrt(np.maximum(var, 0.0))
+        pad = np.full(period - 1, np.nan)
+        sma = pd.Series(np.concatenate([pad, mean]), index=index)
+        band = np.concatenate([pad, num_std * std])
+        upper = sma + band
+        lower = sma - band
+        logger.debug("Bollinger calculation completed for {}", self.symbol)
+        return sma, upper, lower
+
+    def get_obv(self):
+        index, arrays = self._snapshot
+        close = arrays["close"]
+        d = np.diff(close, prepend=close[0])
+        obv = pd.Series(
+            np.cumsum(np.sign(d) * arrays["volume"], dtype=np.float64),
+            index=index,
+        )
+        logger.debug("OBV calculation completed for {}", self.symbol)
+        return obv
+
+    def get_stochastic_oscillator(self, k_period=14, d_period=3):
+        index, arrays = self._snapshot
+        low = arrays["low"]
+        high = arrays["high"]
+        close = arrays["close"]
+        pad = np.full(k_period - 1, np.nan)
+        lo = np.concatenate(
+            [pad, sliding_window_view(low, k_period).min(axis=1)]
+        )
+        hi = np.concatenate(
+            [pad, sliding_window_view(high, k_period).max(axis=1)]
+        )
+        k_vals = 100.0 * (close - lo) / (hi - lo)
+        d_vals = np.full_like(k_vals, np.nan)
+        d_vals[k_period + d_period - 2:] = np.convolve(
+            k_vals[k_period - 1:],
+            np.ones(d_period) / d_period,
+            mode="valid",
+        )
+        k = pd.Series(k_vals, index=index)
+        d = pd.Series(d_vals, index=index)
+        logger.debug("Stochastic calculation completed for {}", self.symbol)
+        return k, d
+
+    def compute_all(self, k_period=14, d_period=3, aroon_period=14):
+        """Aroon, stochastic and OBV from one fused pass over the arrays.
+
+        For callers that want several indicators per tick this reads the
+        OHLCV columns once instead of once per indicator; %D is derived
+        from the fused %K with a short convolution.
+        """
+        index, arrays = self._snapshot
+        aroon_up, aroon_down, k_vals, obv = _fused_indicators(
+            arrays["high"], arrays["low"], arrays["close"],
+            arrays["volume"], k_period, aroon_period,
+        )
+        d_vals = np.full_like(k_vals, np.nan)
+        d_vals[k_period + d_period - 2:] = np.convolve(
+            k_vals[k_period - 1:],
+            np.ones(d_period) / d_period,
+            mode="valid",
+        )
+        logger.debug("Fused indicator pass completed for {}", self.symbol)
+        return {
+            "aroon_up": pd.Series(aroon_up, index=index),
+            "aroon_down": pd.Series(aroon_down, index=index),
+            "stoch_k": pd.Series(k_vals, index=index),
+            "stoch_d": pd.Series(d_vals, index=index),
+            "obv": pd.Series(obv, index=index),
+        }
+
+    def get_momentum(self, period=10):
+        index, arrays = self._snapshot
+        c = arrays["close"]
+        out = np.empty_like(c)
+        out[:period] = np.nan
+        np.subtract(c[period:], c[:-period], out=out[period:])
+        momentum = pd.Series(out, index=index)
+        logger.debug("Momentum calculation completed for {}", self.symbol)
+        return momentum
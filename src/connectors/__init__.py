@@ -0,0 +1,15 @@
+"""Exchange connectors.
+
+PEP 562 lazy re-exports: importing this package does not pull ccxt or
+pandas until a connector class is actually requested.
+"""
+
+__all__ = ["AsyncExchangeConnector", "BybitAsyncConnector"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from src.connectors import async_exchange_connector as _mod
+
+        return getattr(_mod, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,264 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from loguru import logger
+
+# ccxt and pandas/numpy each cost hundreds of ms and tens of MB at import
+# time, so they are loaded on first use rather than at module import.
+_ccxt = None
+_ccxtpro = None
+_np = None
+_pd = None
+
+
+def _load_ccxt():
+    """Import ccxt.async_support (and ccxt.pro when installed) on demand."""
+    global _ccxt, _ccxtpro
+    if _ccxt is None:
+        import ccxt.async_support as ccxt_async
+
+        _ccxt = ccxt_async
+        try:
+            import ccxt.pro as ccxtpro
+        except ImportError:  # ccxt.pro not installed; REST polling still works
+            ccxtpro = None
+        _ccxtpro = ccxtpro
+    return _ccxt, _ccxtpro
+
+
+def _load_frame_libs():
+    """Import numpy and pandas on demand."""
+    global _np, _pd
+    if _np is None:
+        import numpy as np
+        import pandas as pd
+
+        _np, _pd = np, pd
+    return _np, _pd
+
+
+_MS_THRESHOLD = 10**11  # values below this are seconds, not milliseconds
+
+
+def _dt_to_millis(t):
+    # Naive datetimes are taken as UTC; calling .timestamp() on them would
+    # go through mktime (a syscall per call on Linux).
+    if t.tzinfo is None:
+        t = t.replace(tzinfo=timezone.utc)
+    return int(t.timestamp() * 1000)
+
+
+# Type-dispatch table resolved once at import; avoids an isinstance chain
+# on every fetch_ohlcv window in hot back-testing loops.
+_TO_MILLIS = {
+    datetime: _dt_to_millis,
+    int: lambda t: t * 1000 if t < _MS_THRESHOLD else t,
+    float: lambda t: int(t * 1000) if t < _MS_THRESHOLD else int(t),
+}
+
+
+def make_http_connector():
+    """Build a pooled TCP connector suitable for sharing across connectors.
+
+    Reusing warm keep-alive connections saves a TCP+TLS handshake per
+    request; pass the same instance to several connectors (they open their
+    sessions with connector_owner=False) and close it once at shutdown.
+    """
+    import aiohttp
+
+    return aiohttp.TCPConnector(limit=100, keepalive_timeout=60,
+                                ttl_dns_cache=300)
+
+
+class AsyncExchangeConnector:
+    """Base asynchronous connector around a ccxt exchange instance.
+
+    Subclasses are expected to assign ``self._exchange`` in ``__init__``.
+    """
+
+    @staticmethod
+    def _to_millis(t):
+        """Convert a datetime or epoch value to milliseconds since epoch."""
+        try:
+            return _TO_MILLIS[type(t)](t)
+        except KeyError:
+            # Exact-type dispatch misses subclasses — pd.Timestamp is a
+            # datetime, bool is an int — so fall back to isinstance
+            # before rejecting.
+            for klass, convert in _TO_MILLIS.items():
+                if isinstance(t, klass):
+                    return convert(t)
+            raise TypeError(
+                f"Cannot convert {type(t).__name__} to milliseconds"
+            ) from None
+
+    async def fetch_ohlcv(self, symbol, timeframe="1m", start_time=None,
+                          end_time=None, limit=500):
+        """Fetch OHLCV candles and return them as a pandas DataFrame."""
+        if start_time is not None:
+            since = self._to_millis(start_time)
+        else:
+            # Some exchanges treat a missing `since` as "from the beginning"
+            # and return their maximum window; anchoring it to the last
+            # `limit` candles keeps the response as small as the caller
+            # actually asked for.
+            timeframe_ms = self._exchange.parse_timeframe(timeframe) * 1000
+            since = self._exchange.milliseconds() - (limit + 1) * timeframe_ms
+        ohlcv = await self._exchange.fetch_ohlcv(symbol, timeframe, since=since,
+                                                 limit=limit)
+        np, pd = _load_frame_libs()
+        # Build the frame from one typed ndarray: skips pandas' row-wise
+        # type inference and turns the timestamp conversion into a view cast.
+        arr = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+        if end_time is not None:
+            # Candles arrive sorted by timestamp, so the end cut is a
+            # binary search plus slice rather than a Python-level scan.
+            end_ms = self._to_millis(end_time)
+            cut = np.searchsorted(arr[:, 0], end_ms, side="right")
+            arr = arr[:cut]
+        ts = arr[:, 0].astype("int64").view("datetime64[ms]")
+        ohlcv_df = pd.DataFrame(
+            {
+                "timestamp": ts,
+                "open": arr[:, 1],
+                "high": arr[:, 2],
+                "low": arr[:, 3],
+                "close": arr[:, 4],
+                "volume": arr[:, 5],
+            },
+            copy=False,
+        )
+        return ohlcv_df
+
+    def supports_streaming(self):
+        """Whether the underlying exchange can push OHLCV over websocket."""
+        return bool(self._exchange.has.get("watchOHLCV"))
+
+    async def watch_ohlcv(self, symbol, timeframe="1m"):
+        """Await the next OHLCV update pushed by the exchange.
+
+        Returns the exchange's candle cache for the pair; the last entry is
+        the still-open candle, the one before it the most recently closed.
+        """
+        return await self._exchange.watch_ohlcv(symbol, timeframe)
+
+    async def wait_next_candle(self, symbol, timeframe="1m"):
+        """Block until the current candle closes.
+
+        With a streaming exchange this watches the kline feed until the
+        candle timestamp advances (the previous candle just closed);
+        without streaming it sleeps out the remainder of the current
+        timeframe bucket instead of polling on a fixed interval.
+        """
+        if self.supports_streaming():
+            candles = await self.watch_ohlcv(symbol, timeframe)
+            last_ts = candles[-1][0]
+            while True:
+                candles = await self.watch_ohlcv(symbol, timeframe)
+                if candles[-1][0] != last_ts:
+                    return
+        timeframe_ms = self._exchange.parse_timeframe(timeframe) * 1000
+        now = self._exchange.milliseconds()
+        await asyncio.sleep((timeframe_ms - now % timeframe_ms + 1) / 1000)
+
+    async def close(self):
+        await self._exchange.close()
+
+
+class BybitAsyncConnector(AsyncExchangeConnector):
+    """Asynchronous connector for the Bybit exchange."""
+
+    _MARKETS_TTL = 3600.0  # seconds before a cached load_markets goes stale
+
+    def __init__(self, api_key=None, api_secret=None, testnet=False,
+                 http_connector=None):
+        import aiohttp
+
+        ccxt, ccxtpro = _load_ccxt()
+        self._markets_loaded_at: float | None = None
+        config = {"enableRateLimit": True}
+        if api_key and api_secret:
+            config["apiKey"] = api_key
+            config["secret"] = api_secret
+        # Prefer the websocket-capable ccxt.pro client; one connection is
+        # reused for all streams on the exchange.
+        exchange_cls = ccxtpro.bybit if ccxtpro is not None else ccxt.bybit
+        self._exchange = exchange_cls(config)
+        # Replace ccxt's per-instance session with one backed by a pooled
+        # connector so TCP+TLS connections are kept alive and reused. A
+        # caller-supplied connector is shared (not owned) across exchanges.
+        if http_connector is not None:
+            self._exchange.session = aiohttp.ClientSession(
+                connector=http_connector, connector_owner=False
+            )
+        else:
+            self._exchange.session = aiohttp.ClientSession(
+                connector=make_http_connector()
+            )
+        if testnet:
+            self._exchange.set_sandbox_mode(True)
+
+    async def fetch_instruments(self, force_reload=False):
+        """Return the exchange's market definitions.
+
+        ccxt caches markets internally, so a full HTTP refresh is only
+        forced explicitly or once the cached copy is older than the TTL.
+        """
+        stale = (
+            self._markets_loaded_at is not None
+            and time.time() - self._markets_loaded_at > self._MARKETS_TTL
+        )
+        reload = force_reload or stale
+        markets = await self._exchange.load_markets(reload=reload)
+        if reload or self._markets_loaded_at is None:
+            self._markets_loaded_at = time.time()
+        return markets
+
+    async def create_order(self, coin, side, amount, price=None,
+                           order_type="market", params=None):
+        """Place an order and return the raw exchange response."""
+        try:
+            return await self._exchange.create_order(
+                coin, order_type, side, amount, price, params or {}
+            )
+        except _ccxt.BaseError:
+            logger.exception("Failed to create {} {} order for {}",
+                             order_type, side, coin)
+            raise
+
+    async def fetch_order_status(self, order_id, coin):
+        """Return the exchange-side status of one order."""
+        order = await self._exchange.fetch_order(order_id, coin)
+        return order["status"]
+
+    async def _poll_order(self, order_id, coin, attempts=10, interval=0.2):
+        """Fetch a single order by id until it reaches a final status."""
+        order = None
+        for _ in range(attempts):
+            order = await self._exchange.fetch_order(order_id, coin)
+            if order["status"] in ("closed", "canceled"):
+                break
+            await asyncio.sleep(interval)
+        return order
+
+    async def create_market_stop_loss_order(self, coin, side, amount, stop_price):
+        """Place a market stop-loss order and return the resulting order row."""
+        params = {"triggerPrice": stop_price, "reduceOnly": True}
+        response_data = await self.create_order(coin, side, amount,
+                                                order_type="market",
+                                                params=params)
+        # The create response already carries the id; polling that single
+        # order replaces the old sleep + fetch-all + sort dance.
+        order_id = response_data.get("id") or response_data["info"]["orderId"]
+        return await self._poll_order(order_id, coin)
+
+    async def create_market_take_profit_order(self, coin, side, amount,
+                                              take_profit_price):
+        """Place a market take-profit order and return the resulting order row."""
+        params = {"takeProfitPrice": take_profit_price, "reduceOnly": True}
+        response_data = await self.create_order(coin, side, amount,
+                                                order_type="market",
+                                                params=params)
+        order_id = response_data.get("id") or response_data["info"]["orderId"]
+        return await self._poll_order(order_id, coin)
@@ -0,0 +1,140 @@
+"""Shared ClickHouse client for the whole process.
+
+Always import this module as ``src.db.db_connection``. Loading it under
+a second path (e.g. a bare ``db.db_connection`` with src/ on sys.path)
+would create a second module object — and with it a second client,
+pool and query-context cache.
+"""
+
+import os
+import threading
+
+import clickhouse_connect
+import sqlparse
+import urllib3
+from loguru import logger
+
+from src.settings import CLICKHOUSE_CONFIG
+
+# One client per process: connecting (TCP + auth handshake) per query is
+# far more expensive than any of the queries themselves.
+_CLIENT = None
+
+# Concurrent event managers / executor threads all funnel through the one
+# client; back it with an explicitly sized keep-alive pool so throughput
+# scales with the number of workers instead of stalling on connection
+# acquisition. Size it to workers x queries-per-tick.
+_POOL_SIZE = int(os.getenv("CLICKHOUSE_POOL_SIZE", "16"))
+
+
+def get_db_client():
+    """Return the shared ClickHouse client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        pool_mgr = urllib3.PoolManager(maxsize=_POOL_SIZE, block=False)
+        _CLIENT = clickhouse_connect.get_client(
+            **CLICKHOUSE_CONFIG,
+            compress="lz4",
+            pool_mgr=pool_mgr,
+            settings={"async_insert": 1, "wait_for_async_insert": 0},
+        )
+    return _CLIENT
+
+
+# clickhouse-connect has no server-side prepared statements (HTTP
+# protocol), but its QueryContext carries the parsed query and column
+# machinery and can be re-bound with fresh parameters. Cache one per
+# (thread, query string); keying by id() makes the lookup pointer-sized
+# for the interned module-level SQL constants used by the query modules.
+_tls = threading.local()
+_MAX_CACHED_CONTEXTS = 256
+
+
+def _query_context(client, query):
+    cache = getattr(_tls, "contexts", None)
+    if cache is None:
+        cache = _tls.contexts = {}
+    entry = cache.get(id(query))
+    if entry is None or entry[0] is not query:
+        if len(cache) >= _MAX_CACHED_CONTEXTS:
+            # Dynamically built SQL (bulk inserts) gets a fresh id each
+            # call; clearing keeps the cache from growing without bound.
+            cache.clear()
+        context = client.create_query_context(query=query)
+        cache[id(query)] = (query, context)
+        return context
+    return entry[1]
+
+
+def execute_query(query, params=None):
+    """Run a query and return its rows as a list of dicts."""
+    client = get_db_client()
+    context = _query_context(client, query)
+    result = client.query(context=context.updated_copy(parameters=params))
+    column_names = result.column_names
+    return [dict(zip(column_names, row)) for row in result.result_rows]
+
+
+def execute_command(query, params=None):
+    """Run a fire-and-forget statement, skipping the result-set machinery.
+
+    One-shot INSERTs never reuse their (SQL, parameters) pair, so the
+    query-context cache buys nothing there; parameters are bound
+    client-side and the finished statement goes out on the lighter
+    command path with no response parsing.
+    """
+    get_db_client().command(query, parameters=params)
+
+
+def insert_rows(table, rows, column_names):
+    """Bulk-insert pre-shaped row tuples through the native insert path.
+
+    ``client.insert`` ships rows in ClickHouse's binary column format:
+    no SQL string is built or parsed per batch, and column types are
+    resolved once per call rather than per value. Use this instead of a
+    hand-assembled multi-row INSERT whenever the rows are already
+    tuples in column order.
+    """
+    get_db_client().insert(table, rows, column_names=column_names)
+
+
+def execute_query_arrow(query, params=None):
+    """Run a query and return the result as a pyarrow.Table.
+
+    ClickHouse answers in its native columnar format, so this avoids the
+    per-row dict materialisation of execute_query entirely; use it for
+    OHLCV-shaped result sets. Convert with
+    ``table.to_pandas(split_blocks=True, self_destruct=True)`` for a
+    near-zero-copy DataFrame.
+    """
+    return get_db_client().query_arrow(query, parameters=params)
+
+
+def execute_query_df(query, params=None):
+    """Run a query and return the result as a pandas DataFrame."""
+    return get_db_client().query_df(query, parameters=params)
+
+
+def apply_migrations(migrations_dir="migrations"):
+    """Apply every .sql file in the migrations directory, in name order.
+
+    All files share one client session; each file is split into individual
+    statements (migration files are multi-statement) and executed with
+    ``command`` so DDL runs without the query/result machinery.
+    """
+    client = get_db_client()
+    settings = {"max_execution_time": 300}
+    for file_name in sorted(os.listdir(migrations_dir)):
+        if not file_name.endswith(".sql"):
+            continue
+        with open(os.path.join(migrations_dir, file_name)) as sql_file:
+            sql_script = sql_file.read()
+        for statement in sqlparse.split(sql_script):
+            statement = statement.strip().rstrip(";")
+            if not statement:
+                continue
+            try:
+                client.command(statement, settings=settings)
+            except Exception:
+                logger.exception("Migration statement failed in {}", file_name)
+                raise
@@ -0,0 +1,50 @@
+import threading
+import time
+
+# Process-wide switch. Tests (or debugging sessions) can turn every
+# query-module cache off at once to force reads through to the DB.
+_enabled = True
+
+
+def set_cache_enabled(enabled):
+    """Globally enable or disable all TTLCache instances."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+class TTLCache:
+    """Tiny thread-safe TTL cache for slow-changing point lookups.
+
+    The event pipeline re-reads the same portfolio / risk-controller /
+    strategy rows on every tick; caching them for a short TTL removes the
+    hottest repeated round trips. Writers must invalidate the key they
+    touch so edits propagate immediately in-process.
+    """
+
+    def __init__(self, ttl=60.0, maxsize=1024):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def get(self, key):
+        if not _enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[1] < now:
+                return None
+            return entry[0]
+
+    def set(self, key, value):
+        if not _enabled:
+            return
+        with self._lock:
+            if len(self._data) >= self._maxsize:
+                self._data.clear()
+            self._data[key] = (value, time.monotonic() + self._ttl)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
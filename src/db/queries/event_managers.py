@@ -0,0 +1,51 @@
+import uuid
+
+from src.db.db_connection import execute_command, execute_query
+from src.db.queries._ttl_cache import TTLCache
+
+_cache = TTLCache(ttl=60.0)
+
+_INSERT_EVENT_MANAGER_SQL = """
+    INSERT INTO event_managers (event_manager_id, mode, status)
+    VALUES (%(event_manager_id)s, %(mode)s, %(status)s)
+"""
+
+_SELECT_EVENT_MANAGER_BY_ID_SQL = """
+    SELECT event_manager_id, mode, status, created_at
+    FROM event_managers
+    WHERE event_manager_id = %(event_manager_id)s
+"""
+
+_UPDATE_EVENT_MANAGER_STATUS_SQL = """
+    ALTER TABLE event_managers UPDATE status = %(status)s
+    WHERE event_manager_id = %(event_manager_id)s
+"""
+
+
+def add_event_manager(mode, status="created", event_manager_id=None):
+    if event_manager_id is None:
+        event_manager_id = uuid.uuid4()
+    execute_command(_INSERT_EVENT_MANAGER_SQL, {
+        "event_manager_id": event_manager_id,
+        "mode": mode,
+        "status": status,
+    })
+    return event_manager_id
+
+
+def get_event_manager_by_id(event_manager_id):
+    row = _cache.get(str(event_manager_id))
+    if row is not None:
+        return row
+    results = execute_query(_SELECT_EVENT_MANAGER_BY_ID_SQL,
+                            {"event_manager_id": event_manager_id})
+    row = results[0] if results else None
+    if row is not None:
+        _cache.set(str(event_manager_id), row)
+    return row
+
+
+def update_event_manager_status(event_manager_id, status):
+    execute_query(_UPDATE_EVENT_MANAGER_STATUS_SQL,
+                  {"event_manager_id": event_manager_id, "status": status})
+    _cache.invalidate(str(event_manager_id))
@@ -0,0 +1,226 @@
+import uuid
+
+from src.db.db_connection import execute_command, execute_query
+
+# ClickHouse/driver parameter limits make very large VALUES lists fragile;
+# bulk helpers chop their input into batches of this size.
+_MAX_BATCH = 500
+
+_EVENT_COLUMNS = ("event_id", "event_manager_id", "event_type", "priority",
+                  "payload")
+
+# Module-level constants keep one interned string per statement, so the
+# per-thread query-context cache in db_connection hits on identity.
+_INSERT_EVENT_SQL = """
+    INSERT INTO events (event_id, event_manager_id, event_type, priority, payload)
+    VALUES (%(event_id)s, %(event_manager_id)s, %(event_type)s, %(priority)s, %(payload)s)
+"""
+
+# Explicit column lists keep bytes-on-wire proportional to what the
+# consumers actually read, not the table width.
+_EVENT_SELECT_COLUMNS = (
+    "event_id, event_manager_id, event_type, priority, payload, "
+    "created_at, executed_at"
+)
+
+_SELECT_EVENT_BY_ID_SQL = (
+    f"SELECT {_EVENT_SELECT_COLUMNS} FROM events WHERE event_id = %(event_id)s"
+)
+
+_SELECT_EVENT_HEADER_BY_ID_SQL = """
+    SELECT event_id, event_manager_id, event_type, priority, created_at
+    FROM events WHERE event_id = %(event_id)s
+"""
+
+_SELECT_EVENTS_BY_IDS_SQL = (
+    f"SELECT {_EVENT_SELECT_COLUMNS} FROM events WHERE event_id IN %(event_ids)s"
+)
+
+# priority is stored as the enum name (a String); sorting the column
+# directly would order alphabetically ('HIGH' < 'LOW' < 'MEDIUM'), so
+# ordering goes through an explicit name-to-rank transform that mirrors
+# src.event.Priority. Unknown names sink below LOW.
+_PRIORITY_RANK = "transform(priority, ['HIGH', 'MEDIUM', 'LOW'], [0, 1, 2], 3)"
+
+_SELECT_PENDING_EVENTS_SQL = f"""
+    SELECT event_id, event_manager_id, event_type, priority, payload, created_at
+    FROM events
+    WHERE executed_at IS NULL
+    ORDER BY {_PRIORITY_RANK} ASC, created_at ASC
+    LIMIT %(limit)s
+"""
+
+_SELECT_NEXT_EVENT_PER_MANAGER_SQL = f"""
+    SELECT event_id, event_manager_id, event_type, priority, payload,
+           created_at
+    FROM (
+        SELECT event_id, event_manager_id, event_type, priority, payload,
+               created_at,
+               row_number() OVER (
+                   PARTITION BY event_manager_id
+                   ORDER BY {_PRIORITY_RANK} ASC, created_at ASC
+               ) AS rn
+        FROM events
+        WHERE executed_at IS NULL
+    )
+    WHERE rn = 1
+"""
+
+_SELECT_EVENTS_WITH_ORDERS_SQL = """
+    SELECT e.event_id AS event_id, e.event_type AS event_type,
+           e.priority AS priority, e.payload AS payload,
+           e.created_at AS created_at,
+           o.order_id AS order_id, o.order_type AS order_type,
+           o.order_side AS order_side, o.order_status AS order_status,
+           o.target_price AS target_price
+    FROM events AS e
+    LEFT JOIN orders AS o
+        ON o.order_id = toUUIDOrZero(JSONExtractString(e.payload, 'order_id'))
+    WHERE e.event_id IN %(event_ids)s
+"""
+
+_SELECT_NEXT_EVENTS_SQL = f"""
+    SELECT event_id, event_manager_id, event_type, priority, payload, created_at
+    FROM events
+    WHERE event_manager_id = %(event_manager_id)s AND executed_at IS NULL
+    ORDER BY {_PRIORITY_RANK} ASC, created_at ASC
+    LIMIT %(limit)s
+"""
+
+_MARK_EVENT_PROCESSED_SQL = """
+    ALTER TABLE events UPDATE executed_at = now()
+    WHERE event_id = %(event_id)s
+"""
+
+_MARK_EVENTS_PROCESSED_SQL = """
+    ALTER TABLE events UPDATE executed_at = now()
+    WHERE event_id IN %(event_ids)s
+"""
+
+
+def add_event(event_manager_id, event_type, priority, payload):
+    event_id = uuid.uuid4()
+    execute_command(_INSERT_EVENT_SQL, {
+        "event_id": event_id,
+        "event_manager_id": event_manager_id,
+        "event_type": event_type,
+        "priority": priority,
+        "payload": payload,
+    })
+    return event_id
+
+
+def add_events_bulk(events):
+    """Insert many events in one round trip per batch.
+
+    ``events`` is a list of dicts with event_manager_id, event_type,
+    priority and payload keys; IDs are generated here. Returns the new
+    event ids in input order.
+    """
+    event_ids = []
+    for start in range(0, len(events), _MAX_BATCH):
+        batch = events[start:start + _MAX_BATCH]
+        params = {}
+        rows = []
+        for i, event in enumerate(batch):
+            event_id = uuid.uuid4()
+            event_ids.append(event_id)
+            params[f"event_id_{i}"] = event_id
+            for column in _EVENT_COLUMNS[1:]:
+                params[f"{column}_{i}"] = event[column]
+            rows.append(
+                "(" + ", ".join(f"%({column}_{i})s"
+                                for column in _EVENT_COLUMNS) + ")"
+            )
+        query = (
+            "INSERT INTO events (" + ", ".join(_EVENT_COLUMNS) + ") VALUES "
+            + ", ".join(rows)
+        )
+        execute_command(query, params)
+    return event_ids
+
+
+def get_event_by_id(event_id):
+    results = execute_query(_SELECT_EVENT_BY_ID_SQL, {"event_id": event_id})
+    return results[0] if results else None
+
+
+def get_event_header_by_id(event_id):
+    """Event metadata without the payload column, for callers that only
+    dispatch on type/priority."""
+    results = execute_query(_SELECT_EVENT_HEADER_BY_ID_SQL,
+                            {"event_id": event_id})
+    return results[0] if results else None
+
+
+def get_events_by_ids(event_ids):
+    """Fetch several events in one round trip, keyed by event_id."""
+    if not event_ids:
+        return {}
+    results = execute_query(_SELECT_EVENTS_BY_IDS_SQL,
+                            {"event_ids": tuple(event_ids)})
+    return {str(row["event_id"]): row for row in results}
+
+
+def get_pending_events(limit=256):
+    """Fetch one window of pending events across every manager."""
+    return execute_query(_SELECT_PENDING_EVENTS_SQL, {"limit": limit})
+
+
+def get_next_event_per_manager():
+    """Fetch the highest-priority pending event of every manager at once.
+
+    One window query replaces a get_next_event round trip per manager;
+    the caller dispatches rows by event_manager_id.
+    """
+    results = execute_query(_SELECT_NEXT_EVENT_PER_MANAGER_SQL)
+    return {str(row["event_manager_id"]): row for row in results}
+
+
+def get_events_with_orders(event_ids):
+    """Fetch events and the orders their payloads reference, in one trip.
+
+    A handler that reads an event and then looks up the order named in
+    its payload pays two round trips per event. ClickHouse has no stored
+    procedures or multi-statement transactions, so the consolidation is
+    a server-side JOIN on the payload's order_id instead.
+    """
+    if not event_ids:
+        return []
+    return execute_query(_SELECT_EVENTS_WITH_ORDERS_SQL,
+                         {"event_ids": tuple(event_ids)})
+
+
+def get_next_events(event_manager_id, limit=64):
+    """Fetch a prefetch window of pending events, highest priority first.
+
+    Pulling one row per trip makes round trips the bottleneck; a window of
+    ``limit`` rows costs essentially the same trip and lets the caller
+    drain it in-process.
+    """
+    return execute_query(
+        _SELECT_NEXT_EVENTS_SQL,
+        {"event_manager_id": event_manager_id, "limit": limit},
+    )
+
+
+def get_next_event(event_manager_id):
+    results = get_next_events(event_manager_id, limit=1)
+    return results[0] if results else None
+
+
+def mark_event_as_processed(event_id):
+    execute_query(_MARK_EVENT_PROCESSED_SQL, {"event_id": event_id})
+
+
+def mark_events_as_processed(event_ids):
+    """Mark a whole batch of events processed with one mutation.
+
+    Every ALTER ... UPDATE is a heavyweight asynchronous mutation in
+    ClickHouse; callers should accumulate processed ids and flush them
+    per tick so the merge load is O(1) per tick, not O(events).
+    """
+    if not event_ids:
+        return
+    execute_query(_MARK_EVENTS_PROCESSED_SQL,
+                  {"event_ids": tuple(event_ids)})
@@ -0,0 +1,161 @@
+import orjson
+
+from src.db.db_connection import execute_command, execute_query, insert_rows
+from src.db.queries import events as events_db
+from src.utils.fast_uuid import fast_uuid
+
+_MAX_BATCH = 500
+
+_ORDER_COLUMNS = (
+    "order_id", "parent_order_id", "portfolio_id", "strategy_id", "exchange",
+    "symbol", "order_type", "order_side", "order_status", "target_price",
+    "initial_quantity", "executed_quantity", "total_fee", "extra_summary",
+)
+
+_INSERT_ORDER_SQL = """
+    INSERT INTO orders (order_id, parent_order_id, portfolio_id, strategy_id,
+                        exchange, symbol, order_type, order_side, order_status,
+                        target_price, initial_quantity, executed_quantity,
+                        total_fee, extra_summary)
+    VALUES (%(order_id)s, %(parent_order_id)s, %(portfolio_id)s, %(strategy_id)s,
+            %(exchange)s, %(symbol)s, %(order_type)s, %(order_side)s,
+            %(order_status)s, %(target_price)s, %(initial_quantity)s,
+            %(executed_quantity)s, %(total_fee)s, %(extra_summary)s)
+"""
+
+_ORDER_SELECT_COLUMNS = ", ".join(_ORDER_COLUMNS) + ", created_at, updated_at"
+
+_SELECT_ORDER_BY_ID_SQL = (
+    f"SELECT {_ORDER_SELECT_COLUMNS} FROM orders WHERE order_id = %(order_id)s"
+)
+
+_SELECT_ORDERS_BY_IDS_SQL = (
+    f"SELECT {_ORDER_SELECT_COLUMNS} FROM orders WHERE order_id IN %(order_ids)s"
+)
+
+_SELECT_ORDER_STATUS_SQL = (
+    "SELECT order_status FROM orders WHERE order_id = %(order_id)s"
+)
+
+_UPDATE_ORDER_STATUS_SQL = """
+    ALTER TABLE orders UPDATE order_status = %(order_status)s, updated_at = now()
+    WHERE order_id = %(order_id)s
+"""
+
+_UPDATE_ORDERS_STATUS_SQL = """
+    ALTER TABLE orders UPDATE order_status = %(order_status)s, updated_at = now()
+    WHERE order_id IN %(order_ids)s
+"""
+
+
+def add_order(portfolio_id, strategy_id, exchange, symbol, order_type,
+              order_side, order_status, target_price, initial_quantity,
+              executed_quantity, total_fee, extra_summary,
+              parent_order_id=None):
+    order_id = fast_uuid()
+    execute_command(_INSERT_ORDER_SQL, {
+        "order_id": order_id,
+        "parent_order_id": parent_order_id,
+        "portfolio_id": portfolio_id,
+        "strategy_id": strategy_id,
+        "exchange": exchange,
+        "symbol": symbol,
+        "order_type": order_type,
+        "order_side": order_side,
+        "order_status": order_status,
+        "target_price": target_price,
+        "initial_quantity": initial_quantity,
+        "executed_quantity": executed_quantity,
+        "total_fee": total_fee,
+        "extra_summary": extra_summary,
+    })
+    return order_id
+
+
+def add_orders_bulk(orders):
+    """Insert many order rows in one round trip per batch.
+
+    ``orders`` is a list of dicts keyed like the add_order parameters; an
+    order_id is generated for any row that does not carry one. Returns the
+    order ids in input order.
+    """
+    order_ids = []
+    rows = []
+    for order in orders:
+        order_id = order.get("order_id") or fast_uuid()
+        order_ids.append(order_id)
+        rows.append((order_id,)
+                    + tuple(order.get(column) for column in _ORDER_COLUMNS[1:]))
+    for start in range(0, len(rows), _MAX_BATCH):
+        # Native binary insert: no SQL text is assembled or parsed per
+        # batch, and column types are resolved once per call.
+        insert_rows("orders", rows[start:start + _MAX_BATCH], _ORDER_COLUMNS)
+    return order_ids
+
+
+def create_order_and_event(event_manager_id, event_type, priority, order,
+                           payload=None):
+    """Insert an order and the event referencing it without a read-back.
+
+    The naive flow is three trips: insert the order, select its id back,
+    insert the event. ClickHouse has no INSERT ... RETURNING or CTE DML
+    to fold those into one statement, so instead the order_id is
+    generated client-side and stamped into the event payload — both
+    inserts go out as fire-and-forget commands and the id fetch
+    disappears entirely.
+
+    ``order`` is a dict keyed like the add_order parameters; ``payload``
+    is an optional dict merged into the event payload alongside the
+    order_id. Returns ``(order_id, event_id)``.
+    """
+    order_id = order.get("order_id") or fast_uuid()
+    params = {"order_id": order_id}
+    for column in _ORDER_COLUMNS[1:]:
+        params[column] = order.get(column)
+    execute_command(_INSERT_ORDER_SQL, params)
+    event_payload = dict(payload or {})
+    event_payload["order_id"] = str(order_id)
+    event_id = events_db.add_event(
+        event_manager_id, event_type, priority,
+        orjson.dumps(event_payload).decode(),
+    )
+    return order_id, event_id
+
+
+def get_order_by_id(order_id):
+    results = execute_query(_SELECT_ORDER_BY_ID_SQL, {"order_id": order_id})
+    return results[0] if results else None
+
+
+def get_orders_by_ids(order_ids):
+    """Fetch several orders in one round trip, keyed by order_id.
+
+    Point-lookup loops should accumulate their ids and call this once per
+    drain cycle instead of one get_order_by_id round trip per row.
+    """
+    if not order_ids:
+        return {}
+    results = execute_query(_SELECT_ORDERS_BY_IDS_SQL,
+                            {"order_ids": tuple(order_ids)})
+    return {str(row["order_id"]): row for row in results}
+
+
+def get_order_status(order_id):
+    """Point lookup of just the status column — the only one that moves."""
+    results = execute_query(_SELECT_ORDER_STATUS_SQL, {"order_id": order_id})
+    return results[0]["order_status"] if results else None
+
+
+def update_order_status(order_id, order_status):
+    execute_query(_UPDATE_ORDER_STATUS_SQL,
+                  {"order_id": order_id, "order_status": order_status})
+
+
+def update_orders_status(order_ids, order_status):
+    """Move a whole batch of orders to one status with a single mutation."""
+    if not order_ids:
+        return
+    execute_query(_UPDATE_ORDERS_STATUS_SQL, {
+        "order_ids": tuple(order_ids),
+        "order_status": order_status,
+    })
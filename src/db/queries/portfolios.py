@@ -0,0 +1,52 @@
+import uuid
+
+from src.db.db_connection import execute_command, execute_query
+from src.db.queries._ttl_cache import TTLCache
+
+_cache = TTLCache(ttl=60.0)
+
+_INSERT_PORTFOLIO_SQL = """
+    INSERT INTO portfolios (portfolio_id, name, exchange, balance, currency)
+    VALUES (%(portfolio_id)s, %(name)s, %(exchange)s, %(balance)s, %(currency)s)
+"""
+
+_SELECT_PORTFOLIO_BY_ID_SQL = """
+    SELECT portfolio_id, name, exchange, balance, currency, created_at
+    FROM portfolios WHERE portfolio_id = %(portfolio_id)s
+"""
+
+_UPDATE_PORTFOLIO_BALANCE_SQL = """
+    ALTER TABLE portfolios UPDATE balance = %(balance)s
+    WHERE portfolio_id = %(portfolio_id)s
+"""
+
+
+def add_portfolio(name, exchange, balance, currency, portfolio_id=None):
+    if portfolio_id is None:
+        portfolio_id = uuid.uuid4()
+    execute_command(_INSERT_PORTFOLIO_SQL, {
+        "portfolio_id": portfolio_id,
+        "name": name,
+        "exchange": exchange,
+        "balance": balance,
+        "currency": currency,
+    })
+    return portfolio_id
+
+
+def get_portfolio_by_id(portfolio_id):
+    row = _cache.get(str(portfolio_id))
+    if row is not None:
+        return row
+    results = execute_query(_SELECT_PORTFOLIO_BY_ID_SQL,
+                            {"portfolio_id": portfolio_id})
+    row = results[0] if results else None
+    if row is not None:
+        _cache.set(str(portfolio_id), row)
+    return row
+
+
+def update_portfolio_balance(portfolio_id, balance):
+    execute_query(_UPDATE_PORTFOLIO_BALANCE_SQL,
+                  {"portfolio_id": portfolio_id, "balance": balance})
+    _cache.invalidate(str(portfolio_id))
@@ -0,0 +1,94 @@
+import uuid
+
+from src.db.db_connection import execute_command, execute_query
+from src.db.queries._ttl_cache import TTLCache
+
+_MAX_BATCH = 500
+
+_cache = TTLCache(ttl=60.0)
+
+# The settings dict binds like any other parameter: the driver renders
+# it as a properly escaped Map literal, so values containing quotes
+# cannot break (or inject into) the statement.
+_INSERT_RISK_CONTROLLER_SQL = """
+    INSERT INTO risk_controllers (risk_controller_id, name, max_loss,
+                                  max_orders, settings)
+    VALUES (%(risk_controller_id)s, %(name)s, %(max_loss)s, %(max_orders)s,
+            %(settings)s)
+"""
+
+_SELECT_RISK_CONTROLLERS_BY_IDS_SQL = """
+    SELECT risk_controller_id, name, max_loss, max_orders, settings,
+           created_at
+    FROM risk_controllers
+    WHERE risk_controller_id IN %(risk_controller_ids)s
+"""
+
+_SELECT_RISK_CONTROLLER_BY_ID_SQL = """
+    SELECT risk_controller_id, name, max_loss, max_orders, settings,
+           created_at
+    FROM risk_controllers
+    WHERE risk_controller_id = %(risk_controller_id)s
+"""
+
+
+def add_risk_controller(name, max_loss, max_orders, settings=None):
+    risk_controller_id = uuid.uuid4()
+    execute_command(_INSERT_RISK_CONTROLLER_SQL, {
+        "risk_controller_id": risk_controller_id,
+        "name": name,
+        "max_loss": max_loss,
+        "max_orders": max_orders,
+        "settings": settings or {},
+    })
+    return risk_controller_id
+
+
+def add_risk_controllers_bulk(risk_controllers):
+    """Insert many risk controller rows in one round trip per batch."""
+    controller_ids = []
+    for start in range(0, len(risk_controllers), _MAX_BATCH):
+        batch = risk_controllers[start:start + _MAX_BATCH]
+        params = {}
+        rows = []
+        for i, controller in enumerate(batch):
+            controller_id = uuid.uuid4()
+            controller_ids.append(controller_id)
+            params[f"risk_controller_id_{i}"] = controller_id
+            params[f"name_{i}"] = controller["name"]
+            params[f"max_loss_{i}"] = controller["max_loss"]
+            params[f"max_orders_{i}"] = controller["max_orders"]
+            params[f"settings_{i}"] = controller.get("settings") or {}
+            rows.append(
+                f"(%(risk_controller_id_{i})s, %(name_{i})s, %(max_loss_{i})s, "
+                f"%(max_orders_{i})s, %(settings_{i})s)"
+            )
+        query = (
+            "INSERT INTO risk_controllers (risk_controller_id, name, max_loss, "
+            "max_orders, settings) VALUES " + ", ".join(rows)
+        )
+        execute_command(query, params)
+    return controller_ids
+
+
+def get_risk_controllers_by_ids(risk_controller_ids):
+    """Fetch several risk controllers in one round trip, keyed by id."""
+    if not risk_controller_ids:
+        return {}
+    results = execute_query(
+        _SELECT_RISK_CONTROLLERS_BY_IDS_SQL,
+        {"risk_controller_ids": tuple(risk_controller_ids)},
+    )
+    return {str(row["risk_controller_id"]): row for row in results}
+
+
+def get_risk_controller_by_id(risk_controller_id):
+    row = _cache.get(str(risk_controller_id))
+    if row is not None:
+        return row
+    results = execute_query(_SELECT_RISK_CONTROLLER_BY_ID_SQL,
+                            {"risk_controller_id": risk_controller_id})
+    row = results[0] if results else None
+    if row is not None:
+        _cache.set(str(risk_controller_id), row)
+    return row
@@ -0,0 +1,51 @@
+import uuid
+
+from src.db.db_connection import execute_command, execute_query
+from src.db.queries._ttl_cache import TTLCache
+
+_cache = TTLCache(ttl=60.0)
+
+_INSERT_STRATEGY_SQL = """
+    INSERT INTO strategies (strategy_id, name, status, settings)
+    VALUES (%(strategy_id)s, %(name)s, %(status)s, %(settings)s)
+"""
+
+_SELECT_STRATEGY_BY_ID_SQL = """
+    SELECT strategy_id, name, status, settings, created_at
+    FROM strategies WHERE strategy_id = %(strategy_id)s
+"""
+
+_UPDATE_STRATEGY_STATUS_SQL = """
+    ALTER TABLE strategies UPDATE status = %(status)s
+    WHERE strategy_id = %(strategy_id)s
+"""
+
+
+def add_strategy(name, status, settings, strategy_id=None):
+    if strategy_id is None:
+        strategy_id = uuid.uuid4()
+    execute_command(_INSERT_STRATEGY_SQL, {
+        "strategy_id": strategy_id,
+        "name": name,
+        "status": status,
+        "settings": settings,
+    })
+    return strategy_id
+
+
+def get_strategy_by_id(strategy_id):
+    row = _cache.get(str(strategy_id))
+    if row is not None:
+        return row
+    results = execute_query(_SELECT_STRATEGY_BY_ID_SQL,
+                            {"strategy_id": strategy_id})
+    row = results[0] if results else None
+    if row is not None:
+        _cache.set(str(strategy_id), row)
+    return row
+
+
+def update_strategy_status(strategy_id, status):
+    execute_query(_UPDATE_STRATEGY_STATUS_SQL,
+                  {"strategy_id": strategy_id, "status": status})
+    _cache.invalidate(str(strategy_id))
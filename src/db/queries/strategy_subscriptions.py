@@ -0,0 +1,36 @@
+import uuid
+
+from src.db.db_connection import execute_command, execute_query
+
+_INSERT_SUBSCRIPTION_SQL = """
+    INSERT INTO strategy_subscriptions (subscription_id, strategy_id,
+                                        event_manager_id, portfolio_id)
+    VALUES (%(subscription_id)s, %(strategy_id)s, %(event_manager_id)s,
+            %(portfolio_id)s)
+"""
+
+_SELECT_SUBSCRIPTION_BY_ID_SQL = """
+    SELECT subscription_id, strategy_id, event_manager_id, portfolio_id,
+           created_at
+    FROM strategy_subscriptions
+    WHERE subscription_id = %(subscription_id)s
+"""
+
+
+def add_strategy_subscription(strategy_id, event_manager_id, portfolio_id,
+                              subscription_id=None):
+    if subscription_id is None:
+        subscription_id = uuid.uuid4()
+    execute_command(_INSERT_SUBSCRIPTION_SQL, {
+        "subscription_id": subscription_id,
+        "strategy_id": strategy_id,
+        "event_manager_id": event_manager_id,
+        "portfolio_id": portfolio_id,
+    })
+    return subscription_id
+
+
+def get_strategy_subscription_by_id(subscription_id):
+    results = execute_query(_SELECT_SUBSCRIPTION_BY_ID_SQL,
+                            {"subscription_id": subscription_id})
+    return results[0] if results else None
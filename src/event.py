@@ -0,0 +1,123 @@
+import itertools
+import os
+import time
+
+import orjson
+from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import IntEnum
+
+
+class EventType(IntEnum):
+    MARKET = 1
+    ORDER = 2
+    SIGNAL = 3
+    ERROR = 4
+
+
+class Priority(IntEnum):
+    """Lower value = higher priority, so values order a priority queue."""
+
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
+
+
+# Events are created at tick rate, so IDs come from a plain monotonic
+# counter rather than uuid4()'s cryptographic RNG. The pid prefix keeps
+# IDs unique across processes.
+_ID_COUNTER = itertools.count()
+_PROCESS_PREFIX = str(os.getpid())
+
+
+class Event(ABC):
+    """Base class for everything that flows through the event pipeline."""
+
+    # Events are allocated at tick rate; slots drop the per-instance
+    # __dict__ and make attribute access a fixed-offset load. Subclasses
+    # must declare __slots__ = () to keep the benefit.
+    __slots__ = (
+        "_Event__event_id",
+        "_Event__event_type",
+        "_Event__priority",
+        "_Event__created_at_ns",
+        "_Event__metadata",
+        "_Event__metadata_bytes",
+    )
+
+    def __init__(self, event_type, priority, metadata=None):
+        self.__event_id = next(_ID_COUNTER)
+        self.__event_type = event_type
+        self.__priority = priority
+        self.__created_at_ns = time.time_ns()
+        self.__metadata = metadata if metadata is not None else {}
+        # Serialized once here; every downstream sink reuses the buffer
+        # instead of re-encoding per subscriber.
+        self.__metadata_bytes = orjson.dumps(metadata) if metadata else b"{}"
+
+    def get_event_id(self):
+        return f"{_PROCESS_PREFIX}-{self.__event_id}"
+
+    def get_event_type(self):
+        return self.__event_type
+
+    def get_priority(self):
+        return self.__priority
+
+    def get_created_at(self):
+        return datetime.fromtimestamp(self.__created_at_ns / 1e9)
+
+    def get_metadata(self):
+        return self.__metadata
+
+    def get_metadata_bytes(self):
+        """Return the metadata pre-encoded as JSON bytes."""
+        return self.__metadata_bytes
+
+    def set_metadata(self, metadata):
+        self.__metadata = metadata if metadata is not None else {}
+        self.__metadata_bytes = orjson.dumps(metadata) if metadata else b"{}"
+
+    @abstractmethod
+    async def process(self):
+        """Handle the event; called by the event manager's worker."""
+
+
+class MarketEvent(Event):
+    __slots__ = ()
+
+    def __init__(self, priority=Priority.HIGH, metadata=None):
+        super().__init__(EventType.MARKET, priority, metadata)
+
+    async def process(self):
+        return self.get_metadata()
+
+
+class OrderEvent(Event):
+    __slots__ = ()
+
+    def __init__(self, priority=Priority.LOW, metadata=None):
+        super().__init__(EventType.ORDER, priority, metadata)
+
+    async def process(self):
+        return self.get_metadata()
+
+
+class SignalEvent(Event):
+    __slots__ = ()
+
+    def __init__(self, priority=Priority.MEDIUM, metadata=None):
+        super().__init__(EventType.SIGNAL, priority, metadata)
+
+    async def process(self):
+        return self.get_metadata()
+
+
+class ErrorEvent(Event):
+    __slots__ = ()
+
+    def __init__(self, priority=Priority.HIGH, metadata=None):
+        super().__init__(EventType.ERROR, priority, metadata)
+
+    async def process(self):
+        return self.get_metadata()
@@ -0,0 +1,100 @@
+import asyncio
+from collections import defaultdict
+
+from loguru import logger
+
+from src.db.queries import events as events_db
+
+
+class EventDispatcher:
+    """Polls pending events for all managers with one query and fans them
+    out to a fixed pool of workers.
+
+    One dispatcher replaces a polling loop per EventManager: a single
+    poller pulls a window of pending rows across every manager, a shared
+    queue feeds ``workers`` consumer tasks, and a per-manager lock
+    serialises events within a manager while distinct managers proceed in
+    parallel. Handlers are registered per event_manager_id and receive
+    the raw event row.
+    """
+
+    FLUSH_BATCH = 64
+
+    def __init__(self, workers=4, batch_size=256, poll_interval=1.0):
+        self._workers = workers
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._q = asyncio.Queue()
+        self._handlers = {}
+        self._locks = defaultdict(asyncio.Lock)
+        # Ids queued or processed-but-not-yet-flushed; guards against the
+        # poller re-reading rows whose executed_at mutation has not
+        # materialised yet.
+        self._inflight = set()
+        self._processed_ids = []
+        self._running = False
+
+    def register(self, event_manager_id, handler):
+        """Route rows with this event_manager_id to an async handler."""
+        self._handlers[str(event_manager_id)] = handler
+
+    async def run(self):
+        self._running = True
+        worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self._workers)
+        ]
+        try:
+            while self._running:
+                rows = await asyncio.to_thread(
+                    events_db.get_pending_events, self._batch_size
+                )
+                fresh = [
+                    row for row in rows
+                    if row["event_id"] not in self._inflight
+                ]
+                for row in fresh:
+                    self._inflight.add(row["event_id"])
+                    self._q.put_nowait(row)
+                if not fresh:
+                    # Idle moment: flush partial batches so executed_at
+                    # lands (and inflight ids are released) even when
+                    # traffic never fills FLUSH_BATCH.
+                    await self._flush_processed()
+                    await asyncio.sleep(self._poll_interval)
+                elif len(self._processed_ids) >= self.FLUSH_BATCH:
+                    await self._flush_processed()
+        finally:
+            await self._q.join()
+            for task in worker_tasks:
+                task.cancel()
+            await self._flush_processed()
+
+    async def _worker(self):
+        while True:
+            row = await self._q.get()
+            manager_id = str(row["event_manager_id"])
+            handler = self._handlers.get(manager_id)
+            try:
+                async with self._locks[manager_id]:
+                    if handler is not None:
+                        await handler(row)
+                    else:
+                        logger.warning(
+                            "No handler registered for manager {}", manager_id
+                        )
+            except Exception:
+                logger.exception("Event {} failed", row["event_id"])
+            finally:
+                self._processed_ids.append(row["event_id"])
+                self._q.task_done()
+
+    async def _flush_processed(self):
+        if not self._processed_ids:
+            return
+        ids, self._processed_ids = self._processed_ids, []
+        await asyncio.to_thread(events_db.mark_events_as_processed, ids)
+        for event_id in ids:
+            self._inflight.discard(event_id)
+
+    def stop(self):
+        self._running = False
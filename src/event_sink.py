@@ -0,0 +1,91 @@
+import atexit
+import threading
+from collections import deque
+
+from loguru import logger
+
+from src.db.queries import events as events_db
+
+
+class EventSink:
+    """Coalesces event writes off the hot path.
+
+    :meth:`submit` appends to an in-memory deque and returns
+    immediately; a daemon flusher drains the deque into bulk inserts
+    every flush interval, or as soon as the high-water mark is hit, so
+    callers never wait on event-store I/O. A flush is registered with
+    atexit so in-flight events survive a clean shutdown.
+    """
+
+    MAX_BATCH = 500
+    HIGH_WATER = 200
+
+    def __init__(self, flush_interval=0.05):
+        self._flush_interval = flush_interval
+        # deque append/popleft are atomic, so submit never takes a lock.
+        self._events = deque()
+        self._wakeup = threading.Event()
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._flusher, name="event-sink", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def submit(self, event_manager_id, event_type, priority, payload):
+        """Queue one event for the next background flush."""
+        self._events.append({
+            "event_manager_id": event_manager_id,
+            "event_type": event_type,
+            "priority": priority,
+            "payload": payload,
+        })
+        if len(self._events) >= self.HIGH_WATER:
+            self._wakeup.set()
+
+    def _flusher(self):
+        while self._running:
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        """Drain everything queued so far into bulk inserts."""
+        while True:
+            batch = []
+            while self._events and len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(self._events.popleft())
+                except IndexError:
+                    break
+            if not batch:
+                return
+            try:
+                events_db.add_events_bulk(batch)
+            except Exception:
+                logger.exception("Failed to flush {} buffered events",
+                                 len(batch))
+                # Put the batch back at the front, in order, so the next
+                # flusher tick retries it instead of losing the events.
+                self._events.extendleft(reversed(batch))
+                return
+
+    def close(self):
+        self._running = False
+        self._wakeup.set()
+        self._thread.join()
+        self.flush()
+
+
+_sink = None
+_sink_lock = threading.Lock()
+
+
+def get_event_sink():
+    """Return the process-wide sink, starting its flusher on first use."""
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = EventSink()
+    return _sink
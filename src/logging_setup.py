@@ -0,0 +1,21 @@
+import os
+from pathlib import Path
+
+from loguru import logger
+
+# Anchored to the repository root (parent of src/), not the CWD of
+# whoever imports us; overridable for deployments.
+_DEFAULT_LOG_DIR = Path(__file__).resolve().parent.parent / "logs"
+
+
+def configure_file_logging():
+    """Attach the rotating file sink; call once from an entry point.
+
+    Library modules must not add sinks at import time — that is a
+    filesystem side effect for every importer, including the tests.
+    enqueue=True keeps formatting and disk writes on loguru's writer
+    thread, off the hot paths that log.
+    """
+    log_dir = Path(os.getenv("LOG_DIR", _DEFAULT_LOG_DIR))
+    logger.add(log_dir / "trading_system.log", rotation="10 MB",
+               level="INFO", enqueue=True)
@@ -0,0 +1,25 @@
+import asyncio
+
+from src.event import ErrorEvent, MarketEvent, OrderEvent, SignalEvent
+from src.event_manager import EventManager
+from src.logging_setup import configure_file_logging
+
+
+async def main():
+    manager = EventManager()
+    worker = asyncio.create_task(manager.run())
+
+    manager.add_event(MarketEvent(metadata={"symbol": "BTC/USDT"}))
+    manager.add_event(OrderEvent(metadata={"symbol": "BTC/USDT", "side": "buy"}))
+    manager.add_event(SignalEvent(metadata={"signal": "aroon_cross"}))
+    manager.add_event(ErrorEvent(metadata={"reason": "demo"}))
+
+    # Wait for the queue to drain instead of sleeping a fixed interval.
+    await manager.join()
+    manager.stop()
+    await worker
+
+
+if __name__ == "__main__":
+    configure_file_logging()
+    asyncio.run(main())
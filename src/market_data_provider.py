@@ -0,0 +1,173 @@
+import asyncio
+import os
+from collections import defaultdict
+
+from loguru import logger
+
+
+class MarketDataProvider:
+    """Polls OHLCV data for subscribed pairs and fans it out to strategies.
+
+    Strategies subscribe per ``(symbol, timeframe)`` pair; every poll cycle
+    the provider fetches fresh candles for all pairs concurrently, persists
+    them and notifies the subscribed strategies.
+    """
+
+    MAX_INFLIGHT = 256
+
+    def __init__(self, exchange_connector, data_dir="data", poll_interval=1.0,
+                 limit=500):
+        self.exchange_connector = exchange_connector
+        self.data_dir = data_dir
+        os.makedirs(self.data_dir, exist_ok=True)
+        self.poll_interval = poll_interval
+        self.limit = limit
+        self.pairs: set[tuple[str, str]] = set()
+        self.subscribers: dict[tuple[str, str], list] = {}
+        self._running = False
+        self._inflight: set[asyncio.Task] = set()
+        # Subscription-generation counter: the iteration snapshot is only
+        # rebuilt when subscribers change, not once per poll cycle.
+        self._pairs_gen = 0
+        self._cached_gen = -1
+        self._cached_pairs: tuple[tuple[str, str], ...] = ()
+        # ccxt's rateLimit is the minimum delay between requests in ms; use it
+        # to bound how many fetches we put in flight at once. ccxt's own
+        # throttler still paces the actual requests.
+        rate_limit = getattr(exchange_connector._exchange, "rateLimit", 1000) or 1000
+        self._concurrency = max(1, round(1000 / rate_limit))
+
+    def subscribe(self, strategy, symbol, timeframe):
+        key = (symbol, timeframe)
+        self.pairs.add(key)
+        self.subscribers.setdefault(key, []).append(strategy)
+        self._pairs_gen += 1
+
+    def unsubscribe(self, strategy, symbol, timeframe):
+        key = (symbol, timeframe)
+        strategies = self.subscribers.get(key, [])
+        if strategy in strategies:
+            strategies.remove(strategy)
+        if not strategies:
+            self.subscribers.pop(key, None)
+            self.pairs.discard(key)
+        self._pairs_gen += 1
+
+    def _pairs_snapshot(self):
+        """Return a stable tuple of pairs, rebuilt only after (un)subscribes."""
+        if self._cached_gen != self._pairs_gen:
+            self._cached_pairs = tuple(self.pairs)
+            self._cached_gen = self._pairs_gen
+        return self._cached_pairs
+
+    async def fetch_and_store_data(self, symbol, timeframe):
+        df = await self.exchange_connector.fetch_ohlcv(symbol, timeframe,
+                                                       limit=self.limit)
+        # Subscribers get the frame directly; the disk copy is a side task
+        # off the notification path.
+        self._track_task(asyncio.create_task(self._persist(df, symbol,
+                                                           timeframe)))
+        await self.notify_subscribers(symbol, timeframe, df)
+
+    async def _persist(self, df, symbol, timeframe):
+        file_name = f"{symbol.replace('/', '')}_{timeframe}.parquet"
+        file_path = os.path.join(self.data_dir, file_name)
+        # Columnar + compressed: much cheaper to write than CSV and far
+        # cheaper to read back (with column pruning). The write itself is
+        # blocking I/O, so it runs off-loop to keep concurrent fetches
+        # multiplexing.
+        await asyncio.to_thread(
+            df.to_parquet, file_path, engine="pyarrow",
+            compression="snappy", index=False,
+        )
+
+    def _track_task(self, task):
+        """Retain a task handle until it finishes and surface its errors."""
+        self._inflight.add(task)
+        task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task):
+        self._inflight.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background task failed: {}", task.exception())
+
+    async def notify_subscribers(self, symbol, timeframe, df):
+        # Back-pressure: if slow strategies have let tasks pile up, wait for
+        # some to finish before spawning more instead of growing unbounded.
+        if len(self._inflight) > self.MAX_INFLIGHT:
+            await asyncio.wait(self._inflight,
+                               return_when=asyncio.FIRST_COMPLETED)
+        for strategy in self.subscribers.get((symbol, timeframe), []):
+            self._track_task(
+                asyncio.create_task(strategy.on_new_data(symbol, timeframe, df))
+            )
+
+    async def run(self):
+        """Stream candles over websocket when available, else poll REST."""
+        self._running = True
+        if self.exchange_connector.supports_streaming():
+            await self._run_streaming()
+        else:
+            await self._run_polling()
+
+    async def _run_streaming(self):
+        """Keep one long-lived watch task per subscribed pair."""
+        tasks: dict[tuple[str, str], asyncio.Task] = {}
+        while self._running:
+            for pair in self._pairs_snapshot():
+                if pair not in tasks:
+                    tasks[pair] = asyncio.create_task(self._stream_pair(*pair))
+            for pair, task in list(tasks.items()):
+                if pair not in self.pairs:
+                    task.cancel()
+                    del tasks[pair]
+            await asyncio.sleep(self.poll_interval)
+        for task in tasks.values():
+            task.cancel()
+
+    async def _stream_pair(self, symbol, timeframe):
+        last_closed_ts = None
+        while self._running:
+            try:
+                candles = await self.exchange_connector.watch_ohlcv(symbol,
+                                                                    timeframe)
+            except Exception as exc:
+                logger.error("watch_ohlcv({}, {}) failed: {}", symbol,
+                             timeframe, exc)
+                await asyncio.sleep(self.poll_interval)
+                continue
+            if len(candles) < 2:
+                continue
+            # The last candle is still forming; act only when a new candle
+            # has closed since we last notified.
+            closed_ts = candles[-2][0]
+            if last_closed_ts is None or closed_ts > last_closed_ts:
+                last_closed_ts = closed_ts
+                await self.fetch_and_store_data(symbol, timeframe)
+
+    async def _run_polling(self):
+        """Fetch all subscribed pairs concurrently, once per poll interval."""
+        sem = asyncio.Semaphore(self._concurrency)
+
+        async def _task(symbol, timeframe):
+            async with sem:
+                await self.fetch_and_store_data(symbol, timeframe)
+
+        while self._running:
+            # Group pairs sharing a timeframe so each group's fetches go out
+            # as one concurrent burst on the shared session.
+            by_timeframe = defaultdict(list)
+            for symbol, timeframe in self._pairs_snapshot():
+                by_timeframe[timeframe].append(symbol)
+            for timeframe, symbols in by_timeframe.items():
+                results = await asyncio.gather(
+                    *(_task(s, timeframe) for s in symbols),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error("Market data fetch failed: {}", result)
+            await asyncio.sleep(self.poll_interval)
+
+    def stop(self):
+        self._running = False
@@ -0,0 +1,47 @@
+import orjson
+
+from src.db.queries import portfolios as portfolios_db
+from src.db.queries import strategies as strategies_db
+from src.db.queries._ttl_cache import TTLCache
+
+# Strategy settings rarely change between ticks; a short TTL keeps the
+# JSON parse and dict assembly off every trading-loop iteration while
+# edits still propagate within seconds.
+_info_cache = TTLCache(ttl=5.0)
+
+
+def get_strategy_info(strategy_id):
+    """Assemble the live view of one strategy: status plus parsed settings.
+
+    The settings view is memoized for a few seconds per strategy; the
+    status field is refreshed from the row on every call because it
+    carries the stop signal and must never be served stale.
+    """
+    key = str(strategy_id)
+    row = strategies_db.get_strategy_by_id(strategy_id)
+    if row is None:
+        _info_cache.invalidate(key)
+        return None
+    info = _info_cache.get(key)
+    if info is None:
+        info = {
+            "strategy_id": row["strategy_id"],
+            "name": row["name"],
+            "settings": (orjson.loads(row["settings"])
+                         if row["settings"] else {}),
+        }
+        _info_cache.set(key, info)
+    result = dict(info)
+    result["status"] = row["status"]
+    return result
+
+
+def invalidate_strategy_info(strategy_id):
+    """Drop the cached view after editing a strategy's settings."""
+    _info_cache.invalidate(str(strategy_id))
+
+
+def get_portfolio_balance(portfolio_id):
+    """Current balance of one portfolio, or None if it does not exist."""
+    row = portfolios_db.get_portfolio_by_id(portfolio_id)
+    return row["balance"] if row is not None else None
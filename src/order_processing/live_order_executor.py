@@ -0,0 +1,141 @@
+import asyncio
+import threading
+from collections import OrderedDict
+
+from loguru import logger
+
+from src.db.queries import orders as orders_db
+
+
+class LiveOrderExecutor:
+    """Sends orders to the exchange and tracks them until filled.
+
+    Orders enter through :meth:`execute_order`; a monitor coroutine on
+    the executor's event loop drains the tracking set in batches, polls
+    the exchange for fills and re-queues anything still working after a
+    poll interval. The monitor shares the loop (and the warm exchange
+    session) with order placement, and synchronous DB calls are pushed
+    through asyncio.to_thread so the loop keeps multiplexing.
+    """
+
+    BATCH_SIZE = 64
+
+    def __init__(self, exchange, poll_interval=1.0):
+        self.exchange = exchange
+        self.poll_interval = poll_interval
+        # Pending ids live in an insertion-ordered dict: duplicate puts
+        # collapse (O(1) membership) and the monitor still drains FIFO.
+        # Only the loop thread touches it, so no lock is needed.
+        self._pending = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._status_buffer = []
+        self._running = False
+        self._monitor_future = None
+        # One long-lived loop thread for all exchange coroutines: spinning
+        # up an event loop per call would tear down the connector's warm
+        # HTTP session every time.
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="order-executor-loop",
+            daemon=True,
+        )
+        self._loop_thread.start()
+
+    def _run(self, coro, timeout=30.0):
+        """Run a coroutine on the shared loop thread and wait for it."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return future.result(timeout)
+
+    def start(self):
+        self._running = True
+        self._monitor_future = asyncio.run_coroutine_threadsafe(
+            self._monitor_executing_orders(), self._loop
+        )
+
+    def stop(self):
+        self._running = False
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+        if self._monitor_future is not None:
+            self._monitor_future.result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+
+    def execute_order(self, order_id):
+        """Send one stored order to the exchange and start tracking it."""
+        order = orders_db.get_order_by_id(order_id)
+        if order is None:
+            logger.error("Order {} not found, nothing to execute", order_id)
+            return None
+        response = self._run(self.exchange.create_order(
+            order["symbol"],
+            order["order_side"],
+            float(order["initial_quantity"]),
+            price=float(order["target_price"]),
+            order_type=order["order_type"],
+        ))
+        orders_db.update_order_status(order_id, "executing")
+        self._loop.call_soon_threadsafe(self._track, order_id, order)
+        return response
+
+    def _track(self, order_id, order):
+        self._pending[order_id] = order
+        self._wakeup.set()
+
+    async def _drain_batch(self):
+        """Wait until ids are pending, then take up to BATCH_SIZE of them."""
+        while not self._pending:
+            if not self._running:
+                return []
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                continue
+        count = min(self.BATCH_SIZE, len(self._pending))
+        return [self._pending.popitem(last=False) for _ in range(count)]
+
+    async def _flush_statuses(self):
+        """Write buffered status transitions with one mutation per status."""
+        if not self._status_buffer:
+            return
+        transitions, self._status_buffer = self._status_buffer, []
+        by_status = {}
+        for order_id, status in transitions:
+            by_status.setdefault(status, []).append(order_id)
+        for status, ids in by_status.items():
+            await asyncio.to_thread(orders_db.update_orders_status,
+                                    ids, status)
+
+    async def _monitor_executing_orders(self):
+        # Only the status can change while an order is working, so the row
+        # cached at enqueue time is reused for every poll instead of
+        # re-reading it from the DB each cycle.
+        while self._running:
+            batch = await self._drain_batch()
+            if not batch:
+                continue
+            still_working = []
+            for order_id, order in batch:
+                try:
+                    status = await self.exchange.fetch_order_status(
+                        str(order_id), order["symbol"]
+                    )
+                except Exception as exc:
+                    # A transient exchange error must not kill the monitor:
+                    # keep tracking the order and retry it next cycle.
+                    logger.error("Status poll for order {} failed: {}",
+                                 order_id, exc)
+                    still_working.append((order_id, order))
+                    continue
+                if status == "closed":
+                    self._status_buffer.append((order_id, "executed"))
+                elif status == "canceled":
+                    self._status_buffer.append((order_id, "canceled"))
+                else:
+                    still_working.append((order_id, order))
+            await self._flush_statuses()
+            await asyncio.sleep(self.poll_interval)
+            for order_id, order in still_working:
+                self._track(order_id, order)
+        await self._flush_statuses()
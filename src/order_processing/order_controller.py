@@ -0,0 +1,185 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+import orjson
+from loguru import logger
+
+from src.db.queries import orders as orders_db
+from src.event_sink import get_event_sink
+from src.utils.fast_uuid import fast_uuid
+
+# Parsed once at import: Decimal("...") runs the decimal string parser
+# on every call, and create_order needs these on every order set.
+_DEC_ZERO = Decimal("0")
+_DEC_ZERO_0 = Decimal("0.0")
+
+# Single C-level dict lookup instead of a branch, and the only valid
+# sides are encoded in one place — anything else raises KeyError.
+_OPPOSITE_SIDE = {"buy": "sell", "sell": "buy"}
+
+
+@dataclass(slots=True, frozen=True)
+class OrderRequest:
+    """Validated, immutable description of one requested order set.
+
+    Construction doubles as validation: a successfully built request is
+    safe to persist, so create_order no longer interleaves checks with
+    row assembly. slots keeps the per-request footprint down.
+    """
+
+    portfolio_id: object
+    strategy_id: object
+    exchange: str
+    symbol: str
+    order_side: str
+    target_price: Decimal
+    quantity: Decimal
+    order_type: str = "limit"
+    stop_loss_price: Decimal | None = None
+    take_profit_price: Decimal | None = None
+    extra_summary: str = ""
+
+    def __post_init__(self):
+        if self.portfolio_id is None:
+            raise ValueError("portfolio_id is required")
+        if self.strategy_id is None:
+            raise ValueError("strategy_id is required")
+        if not self.exchange:
+            raise ValueError("exchange is required")
+        if not self.symbol:
+            raise ValueError("symbol is required")
+        if self.order_side not in ("buy", "sell"):
+            raise ValueError(f"invalid order_side: {self.order_side!r}")
+        if self.order_type not in ("limit", "market"):
+            raise ValueError(f"invalid order_type: {self.order_type!r}")
+        if self.target_price is None or self.target_price <= _DEC_ZERO:
+            raise ValueError("target_price must be positive")
+        if self.quantity is None or self.quantity <= _DEC_ZERO:
+            raise ValueError("quantity must be positive")
+        if self.stop_loss_price is not None and self.stop_loss_price <= _DEC_ZERO:
+            raise ValueError("stop_loss_price must be positive")
+        if (self.take_profit_price is not None
+                and self.take_profit_price <= _DEC_ZERO):
+            raise ValueError("take_profit_price must be positive")
+
+
+class OrderController:
+    """Creates order sets (main plus protective children) and their events.
+
+    A signal becomes up to three order rows — main, stop-loss, take-profit
+    — and one OrderPlacementEvent per row. All ids are pre-generated in
+    Python, so the whole set lands in the DB with one bulk insert per
+    table instead of a round trip per row.
+    """
+
+    def create_order(self, event_manager_id, portfolio_id, strategy_id,
+                     exchange, symbol, order_side, target_price, quantity,
+                     order_type="limit", stop_loss_price=None,
+                     take_profit_price=None, extra_summary="",
+                     order_id=None):
+        """Persist a full order set and return the main order id.
+
+        Callers that batch work can pass a pre-generated ``order_id``
+        to skip id generation here.
+        """
+        request = OrderRequest(
+            portfolio_id=portfolio_id,
+            strategy_id=strategy_id,
+            exchange=exchange,
+            symbol=symbol,
+            order_side=order_side,
+            target_price=target_price,
+            quantity=quantity,
+            order_type=order_type,
+            stop_loss_price=stop_loss_price,
+            take_profit_price=take_profit_price,
+            extra_summary=extra_summary,
+        )
+        return self._persist(event_manager_id, request, order_id)
+
+    def _persist(self, event_manager_id, request, order_id=None):
+        """Turn a validated request into order rows, events and inserts."""
+        main_order_id = order_id if order_id is not None else fast_uuid()
+        main_order = {
+            "order_id": main_order_id,
+            "parent_order_id": None,
+            "portfolio_id": request.portfolio_id,
+            "strategy_id": request.strategy_id,
+            "exchange": request.exchange,
+            "symbol": request.symbol,
+            "order_type": request.order_type,
+            "order_side": request.order_side,
+            "order_status": "awaiting",
+            "target_price": request.target_price,
+            "initial_quantity": request.quantity,
+            "executed_quantity": _DEC_ZERO_0,
+            "total_fee": _DEC_ZERO_0,
+            "extra_summary": request.extra_summary,
+        }
+        order_rows = [main_order]
+        if request.stop_loss_price is not None:
+            order_rows.append(self._create_stop_loss_order(
+                main_order_id, main_order, request.stop_loss_price
+            ))
+        if request.take_profit_price is not None:
+            order_rows.append(self._create_take_profit_order(
+                main_order_id, main_order, request.take_profit_price
+            ))
+        event_rows = [
+            self._placement_event(event_manager_id, row)
+            for row in order_rows
+        ]
+        try:
+            orders_db.add_orders_bulk(order_rows)
+        except Exception:
+            logger.exception("Failed to create order set for {}", request.symbol)
+            raise
+        # Placement events ride the background sink: the signal path never
+        # waits on event-store I/O.
+        sink = get_event_sink()
+        for event_row in event_rows:
+            sink.submit(**event_row)
+        logger.info("Main order created with ID: {}", main_order_id)
+        return main_order_id
+
+    # The two child builders differed only in their order_type literal;
+    # a closure factory specializes that once and both names bind the
+    # same code object with the literal captured in its cell.
+    def _make_child_builder(order_type):
+        def _build(self, parent_order_id, parent_order_data, price):
+            # The parent row already carries every shared field; copy it
+            # once and patch only what differs for the child.
+            row = parent_order_data.copy()
+            row.update(
+                order_id=fast_uuid(),
+                parent_order_id=parent_order_id,
+                order_type=order_type,
+                order_side=_OPPOSITE_SIDE[parent_order_data["order_side"]],
+                target_price=price,
+            )
+            return row
+        return _build
+
+    _create_stop_loss_order = _make_child_builder("stop_loss")
+    _create_take_profit_order = _make_child_builder("take_profit")
+    del _make_child_builder
+
+    @staticmethod
+    def _placement_event(event_manager_id, order_row):
+        payload = orjson.dumps({
+            "order_id": str(order_row["order_id"]),
+            "order_status": order_row["order_status"],
+        }).decode()
+        return {
+            "event_manager_id": event_manager_id,
+            "event_type": "ORDER",
+            "priority": "LOW",
+            "payload": payload,
+        }
+
+
+# The one controller for the process, created at import. A module-level
+# instance is the Pythonic singleton: call sites do a LOAD_GLOBAL
+# instead of re-entering __new__, and there is no first-init race to
+# guard against.
+order_controller = OrderController()
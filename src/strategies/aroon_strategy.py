@@ -0,0 +1,40 @@
+import numpy as np
+
+from src.strategies.base_strategy import BaseStrategy
+
+
+class AroonStrategy(BaseStrategy):
+    """Trades fresh crosses of the Aroon oscillator through zero.
+
+    The oscillator (aroon up minus aroon down) flips sign when trend
+    leadership changes; a cross within the last ``filter_frames`` bars
+    emits a signal, strong if the oscillator has already cleared the
+    configured threshold.
+    """
+
+    def get_signal(self):
+        return self.calculate_aroon()
+
+    def calculate_aroon(self):
+        # One dict-chain walk for the whole evaluation.
+        settings = self.info["settings"]
+        aroon_up, aroon_down = self.analysis.get_aroon(
+            int(settings["period"])
+        )
+        osc = (aroon_up - aroon_down).to_numpy()
+        osc = osc[~np.isnan(osc)]
+        if osc.size < 2:
+            return 0
+        last = osc[-1]
+        if last == 0:
+            return 0
+        # One vectorized pass locates the most recent sign change instead
+        # of walking the series backwards element by element.
+        changed = np.where(np.sign(osc) != np.sign(last))[0]
+        cross_pos = (changed[-1] + 1) if changed.size else 0
+        if osc.size - cross_pos > int(settings["filter_frames"]):
+            return 0
+        threshold = float(settings["upper_threshold"])
+        if last > 0:
+            return 2 if last >= threshold else 1
+        return -2 if -last >= threshold else -1
@@ -0,0 +1,101 @@
+import asyncio
+from decimal import Decimal
+
+from loguru import logger
+
+from src import monitoring
+from src.analysis.market_analysis import MarketAnalysis
+from src.order_processing.order_controller import order_controller
+
+
+class BaseStrategy:
+    """Common trading loop for signal strategies.
+
+    Subclasses implement :meth:`get_signal` returning a signed strength
+    code: 2/-2 for a strong buy/sell, 1/-1 for a weak one, 0 for no
+    action.
+    """
+
+    def __init__(self, strategy_id, exchange, symbol, event_manager_id,
+                 portfolio_id):
+        self.strategy_id = strategy_id
+        self.exchange = exchange
+        self.symbol = symbol
+        self.event_manager_id = event_manager_id
+        self.portfolio_id = portfolio_id
+        self.info = {}
+        self.analysis = MarketAnalysis(exchange, symbol)
+
+    def update_info(self):
+        """Refresh strategy config and portfolio balance from the DB."""
+        info = monitoring.get_strategy_info(self.strategy_id)
+        if info is None:
+            raise RuntimeError(f"Strategy {self.strategy_id} not found")
+        info["balance"] = monitoring.get_portfolio_balance(self.portfolio_id)
+        self.info = info
+
+    def get_signal(self):
+        raise NotImplementedError
+
+    async def on_tick(self, df):
+        """Evaluate one fresh OHLCV frame; False once the strategy stops."""
+        self.update_info()
+        if self.info["status"] == "stopped":
+            logger.info("Strategy {} stopped", self.strategy_id)
+            return False
+        settings = self.info["settings"]
+        # Decision math runs in float: Decimal is for the ledger, and
+        # it is orders of magnitude slower per op on this hot path.
+        balance = float(self.info["balance"])
+        loss_coef = float(settings["loss_coef"])
+        self.analysis.get_ohlcv(df)
+        signal = self.get_signal()
+        if signal > 0:
+            await self.open_position("buy", balance, loss_coef)
+        elif signal < 0:
+            await self.open_position("sell", balance, loss_coef)
+        return True
+
+    async def trading(self):
+        """Standalone loop for running one strategy outside a scheduler."""
+        self.update_info()
+        while True:
+            settings = self.info["settings"]
+            df = await self.exchange.fetch_ohlcv(
+                self.symbol,
+                settings["timeframe"],
+                limit=int(settings["limit"]),
+            )
+            if not await self.on_tick(df):
+                break
+            # Wake on candle close instead of a fixed cadence: between
+            # closes the indicators cannot change, so polling them was
+            # pure waste.
+            await self.exchange.wait_next_candle(
+                self.symbol, settings["timeframe"]
+            )
+
+    async def open_position(self, side, balance, loss_coef):
+        """Size a position off the last close and hand it to the controller.
+
+        Sizing happens in float; values are quantized to Decimal only at
+        the order-submission boundary, where ledger precision starts to
+        matter.
+        """
+        price = float(self.analysis.df["close"].iloc[-1])
+        quantity = balance / price
+        if side == "buy":
+            stop_loss_price = price * (1.0 - loss_coef)
+        else:
+            stop_loss_price = price * (1.0 + loss_coef)
+        order_controller.create_order(
+            self.event_manager_id,
+            self.portfolio_id,
+            self.strategy_id,
+            self.info["settings"]["exchange"],
+            self.symbol,
+            side,
+            Decimal(str(price)),
+            Decimal(str(quantity)),
+            stop_loss_price=Decimal(str(stop_loss_price)),
+        )
@@ -0,0 +1,40 @@
+import numpy as np
+
+from src.strategies.base_strategy import BaseStrategy
+
+
+class MACDStrategy(BaseStrategy):
+    """Trades fresh MACD/signal-line crossovers.
+
+    A crossover within the last ``filter_frames`` bars emits a signal in
+    the direction of the cross; it is strong when the MACD line has
+    also cleared zero on the same side.
+    """
+
+    def get_signal(self):
+        return self.calculate_moving_averages()
+
+    def calculate_moving_averages(self):
+        settings = self.info["settings"]
+        macd, signal = self.analysis.get_macd(
+            int(settings["fast_period"]),
+            int(settings["slow_period"]),
+            int(settings["signal_period"]),
+        )
+        d = (macd - signal).to_numpy()
+        d = d[~np.isnan(d)]
+        if d.size < 2:
+            return 0
+        # All crossings fall out of one sign-diff pass over the spread;
+        # only the last one matters for the signal.
+        sign = np.sign(d)
+        idx = np.flatnonzero(sign[1:] != sign[:-1])
+        if idx.size == 0:
+            return 0
+        cross_pos = idx[-1] + 1
+        if d.size - cross_pos > int(settings["filter_frames"]):
+            return 0
+        macd_last = macd.to_numpy()[-1]
+        if d[cross_pos] > 0:
+            return 2 if macd_last > 0 else 1
+        return -2 if macd_last < 0 else -1
@@ -0,0 +1,89 @@
+import asyncio
+from collections import defaultdict
+
+from loguru import logger
+
+
+class StrategyScheduler:
+    """Drives many strategies off one fetch loop per timeframe.
+
+    Running each strategy as its own ``while True`` coroutine meant one
+    OHLCV request per strategy per candle, all firing at the same
+    instant. The scheduler groups strategies by timeframe, fetches each
+    distinct symbol once per candle close, and fans the frame out to
+    every strategy subscribed to it via :meth:`BaseStrategy.on_tick`.
+    """
+
+    def __init__(self, exchange):
+        self.exchange = exchange
+        self._by_timeframe = defaultdict(list)
+        self._tasks = {}
+        self._running = False
+
+    def register(self, strategy):
+        """Subscribe a strategy; starts its timeframe loop if needed."""
+        strategy.update_info()
+        timeframe = strategy.info["settings"]["timeframe"]
+        self._by_timeframe[timeframe].append(strategy)
+        if self._running and timeframe not in self._tasks:
+            self._tasks[timeframe] = asyncio.create_task(
+                self._run_timeframe(timeframe)
+            )
+
+    async def run(self):
+        """Start one loop per registered timeframe and run until stopped."""
+        self._running = True
+        for timeframe in self._by_timeframe:
+            if timeframe not in self._tasks:
+                self._tasks[timeframe] = asyncio.create_task(
+                    self._run_timeframe(timeframe)
+                )
+        try:
+            while self._running:
+                await asyncio.sleep(1.0)
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        self._running = False
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_timeframe(self, timeframe):
+        """Fetch each symbol once per candle and dispatch to subscribers."""
+        while self._running:
+            strategies = self._by_timeframe[timeframe]
+            if not strategies:
+                await asyncio.sleep(1.0)
+                continue
+            # Deduplicate symbols across strategies: ten strategies on
+            # BTC/USDT share one request instead of issuing ten.
+            by_symbol = defaultdict(list)
+            for strategy in strategies:
+                by_symbol[strategy.symbol].append(strategy)
+            limit = max(
+                int(s.info["settings"].get("limit", 500)) for s in strategies
+            )
+            symbols = list(by_symbol)
+            frames = await asyncio.gather(
+                *(self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+                  for symbol in symbols),
+                return_exceptions=True,
+            )
+            stopped = []
+            for symbol, df in zip(symbols, frames):
+                if isinstance(df, Exception):
+                    logger.warning("OHLCV fetch failed for {} {}: {}",
+                                   symbol, timeframe, df)
+                    continue
+                for strategy in by_symbol[symbol]:
+                    if not await strategy.on_tick(df):
+                        stopped.append(strategy)
+            for strategy in stopped:
+                strategies.remove(strategy)
+            if not strategies:
+                continue
+            await self.exchange.wait_next_candle(symbols[0], timeframe)
@@ -0,0 +1,21 @@
+"""Optional numba import with a transparent no-op fallback.
+
+Kernels decorated through this module compile to native code when numba
+is installed and run as plain Python otherwise — same results, just
+slower, so numba stays an optional dependency.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
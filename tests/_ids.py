@@ -0,0 +1,12 @@
+"""Pre-generated ids for the test suite.
+
+UUID generation is not free; pools built once at import keep it out of
+test bodies and hot worker loops — tests slice what they need instead
+of calling the generator per iteration.
+"""
+
+from src.utils.fast_uuid import fast_uuid
+
+PORTFOLIO_IDS = [fast_uuid() for _ in range(32)]
+STRATEGY_IDS = [fast_uuid() for _ in range(32)]
+ORDER_IDS = [fast_uuid() for _ in range(128)]
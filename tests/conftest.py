@@ -0,0 +1,76 @@
+"""Session-wide DB bootstrap shared by every test package.
+
+The schema is applied exactly once per run and the shared client is
+warmed before the first test. ClickHouse offers neither template
+databases nor transactional rollback, so tests never assume empty
+tables: they key rows by their own generated ids and compare counts as
+before/after deltas rather than absolute table sizes.
+"""
+
+import os
+
+import pytest
+
+from src.db.db_connection import apply_migrations, get_db_client
+from src.db.queries import event_managers as event_managers_db
+from src.db.queries import portfolios as portfolios_db
+from src.db.queries import strategies as strategies_db
+from src.settings import CLICKHOUSE_CONFIG
+
+
+def _isolate_xdist_worker():
+    """Point this process at a per-worker database under pytest-xdist.
+
+    Runs before the shared client is built, so every query helper in the
+    worker lands in its own database and parallel workers never see each
+    other's rows.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker_id:
+        return
+    import clickhouse_connect
+
+    database = f"{CLICKHOUSE_CONFIG['database']}_{worker_id}"
+    admin = clickhouse_connect.get_client(
+        **{**CLICKHOUSE_CONFIG, "database": "default"}
+    )
+    admin.command(f"CREATE DATABASE IF NOT EXISTS {database}")
+    admin.close()
+    CLICKHOUSE_CONFIG["database"] = database
+
+
+# Not autouse: only fixtures that actually touch the DB depend on this,
+# so pytest -m 'not db' runs the in-memory tests without a reachable
+# ClickHouse.
+@pytest.fixture(scope="session")
+def _db_bootstrap():
+    _isolate_xdist_worker()
+    apply_migrations()
+    client = get_db_client()
+    # Inserts normally ride async_insert without waiting; tests read
+    # straight after writing, so the wait flag is on for the session.
+    client.set_client_setting("wait_for_async_insert", 1)
+    # ALTER ... UPDATE mutations are asynchronous by default; without
+    # this, every read-after-update assertion would race the mutation.
+    client.set_client_setting("mutations_sync", 1)
+    # Warm the keep-alive pool so no test pays the handshake.
+    for _ in range(5):
+        client.command("SELECT 1")
+
+
+# One live event-manager row (and the portfolio/strategy rows hanging
+# off it) serves every order-controller test; creating them per test
+# added three INSERTs to each.
+@pytest.fixture(scope="session")
+def live_event_manager_id(_db_bootstrap):
+    return event_managers_db.add_event_manager("live")
+
+
+@pytest.fixture(scope="session")
+def seed_portfolio_id(_db_bootstrap):
+    return portfolios_db.add_portfolio("oc-test", "bybit", "1000.0", "USDT")
+
+
+@pytest.fixture(scope="session")
+def seed_strategy_id(_db_bootstrap):
+    return strategies_db.add_strategy("oc-test", "created", "{}")
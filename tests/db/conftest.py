@@ -0,0 +1,58 @@
+"""Shared DB fixtures for the query-module tests.
+
+One client and one set of seed rows serve the whole session: connection
+setup and the common INSERTs happen once instead of once per test.
+ClickHouse has no transactions or savepoints to roll back per test, so
+isolation comes from ids instead — every test works against rows keyed
+by its own generated UUIDs and asserts via point lookups.
+"""
+
+import pytest
+
+from src.db.db_connection import get_db_client
+from src.db.queries._ttl_cache import set_cache_enabled
+from src.db.queries import event_managers as event_managers_db
+from src.db.queries import portfolios as portfolios_db
+from src.db.queries import risk_controllers as risk_controllers_db
+from src.db.queries import strategies as strategies_db
+
+
+@pytest.fixture(scope="session")
+def db_client(_db_bootstrap):
+    """The process-wide client; schema and warm-up come from the
+    session bootstrap in tests/conftest.py."""
+    return get_db_client()
+
+
+@pytest.fixture(scope="session")
+def event_manager_id(db_client):
+    return event_managers_db.add_event_manager("test")
+
+
+@pytest.fixture(scope="session")
+def portfolio_id(db_client):
+    return portfolios_db.add_portfolio("test-portfolio", "bybit",
+                                       "1000.0", "USDT")
+
+
+@pytest.fixture(scope="session")
+def risk_controller_id(db_client):
+    return risk_controllers_db.add_risk_controller("test-risk", "100.0", 10)
+
+
+@pytest.fixture(scope="session")
+def strategy_id(db_client):
+    return strategies_db.add_strategy("test-strategy", "created", "{}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _point_lookup_cache():
+    """Keep the query-module caches on for the suite.
+
+    The add_*/update_* helpers invalidate the keys they touch, so the
+    read-after-write tests stay correct while repeated re-reads of the
+    session seed rows are served from memory.
+    """
+    set_cache_enabled(True)
+    yield
+    set_cache_enabled(True)
@@ -0,0 +1,57 @@
+import pytest
+
+from _ids import ORDER_IDS
+
+from src.db.queries import orders as orders_db
+
+pytestmark = pytest.mark.db
+
+
+def test_add_and_get_order(portfolio_id, strategy_id):
+    order_id = orders_db.add_order(
+        portfolio_id, strategy_id, "bybit", "BTC/USDT", "limit", "buy",
+        "awaiting", "50000.0", "0.1", "0.0", "0.0", "",
+    )
+    row = orders_db.get_order_by_id(order_id)
+    assert row is not None
+    assert row["symbol"] == "BTC/USDT"
+    assert row["order_side"] == "buy"
+    assert row["order_status"] == "awaiting"
+
+
+def test_add_orders_bulk(portfolio_id, strategy_id):
+    # Pre-generated ids from the shared pool: the bulk path must honour
+    # caller-supplied order_ids rather than minting its own.
+    orders = [
+        {
+            "order_id": ORDER_IDS[i],
+            "portfolio_id": portfolio_id,
+            "strategy_id": strategy_id,
+            "exchange": "bybit",
+            "symbol": symbol,
+            "order_type": "limit",
+            "order_side": "buy",
+            "order_status": "awaiting",
+            "target_price": "100.0",
+            "initial_quantity": "1.0",
+            "executed_quantity": "0.0",
+            "total_fee": "0.0",
+            "extra_summary": "",
+        }
+        for i, symbol in enumerate(("BTC/USDT", "ETH/USDT"))
+    ]
+    order_ids = orders_db.add_orders_bulk(orders)
+    assert order_ids == ORDER_IDS[:2]
+    rows = orders_db.get_orders_by_ids(order_ids)
+    assert len(rows) == 2
+    assert {row["symbol"] for row in rows.values()} == {"BTC/USDT",
+                                                        "ETH/USDT"}
+
+
+def test_update_order_status(portfolio_id, strategy_id):
+    order_id = orders_db.add_order(
+        portfolio_id, strategy_id, "bybit", "BTC/USDT", "limit", "sell",
+        "awaiting", "50000.0", "0.1", "0.0", "0.0", "",
+    )
+    orders_db.update_order_status(order_id, "executed")
+    assert orders_db.get_order_status(order_id) == "executed"
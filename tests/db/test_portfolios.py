@@ -0,0 +1,26 @@
+import pytest
+
+from _ids import PORTFOLIO_IDS
+
+from src.db.queries import portfolios as portfolios_db
+
+pytestmark = pytest.mark.db
+
+
+@pytest.mark.parametrize("explicit_id", [None, PORTFOLIO_IDS[0]])
+def test_add_and_get_portfolio(db_client, explicit_id):
+    new_id = portfolios_db.add_portfolio("main", "bybit", "500.0", "USDT",
+                                         portfolio_id=explicit_id)
+    if explicit_id is not None:
+        assert new_id == explicit_id
+    row = portfolios_db.get_portfolio_by_id(new_id)
+    assert row is not None
+    assert row["name"] == "main"
+    assert row["currency"] == "USDT"
+
+
+def test_update_portfolio_balance(db_client):
+    new_id = portfolios_db.add_portfolio("main", "bybit", "500.0", "USDT")
+    portfolios_db.update_portfolio_balance(new_id, "750.0")
+    row = portfolios_db.get_portfolio_by_id(new_id)
+    assert float(row["balance"]) == 750.0
@@ -0,0 +1,28 @@
+import pytest
+
+from src.db.queries import risk_controllers as risk_controllers_db
+
+pytestmark = pytest.mark.db
+
+
+@pytest.mark.parametrize("settings", [None, {"max_leverage": "3"}])
+def test_add_and_get_risk_controller(db_client, settings):
+    new_id = risk_controllers_db.add_risk_controller("basic", "50.0", 5,
+                                                     settings=settings)
+    row = risk_controllers_db.get_risk_controller_by_id(new_id)
+    assert row is not None
+    assert row["name"] == "basic"
+    assert row["max_orders"] == 5
+    if settings is not None:
+        assert row["settings"].get("max_leverage") == "3"
+
+
+def test_add_risk_controllers_bulk(db_client):
+    controllers = [
+        {"name": f"bulk-{i}", "max_loss": "10.0", "max_orders": i + 1}
+        for i in range(3)
+    ]
+    ids = risk_controllers_db.add_risk_controllers_bulk(controllers)
+    assert len(ids) == 3
+    rows = risk_controllers_db.get_risk_controllers_by_ids(ids)
+    assert len(rows) == 3
@@ -0,0 +1,27 @@
+import pytest
+
+from _ids import STRATEGY_IDS
+
+from src.db.queries import strategies as strategies_db
+
+pytestmark = pytest.mark.db
+
+
+@pytest.mark.parametrize("explicit_id", [None, STRATEGY_IDS[0]])
+def test_add_and_get_strategy(db_client, explicit_id):
+    new_id = strategies_db.add_strategy("aroon", "created",
+                                        '{"period": 14}',
+                                        strategy_id=explicit_id)
+    if explicit_id is not None:
+        assert new_id == explicit_id
+    row = strategies_db.get_strategy_by_id(new_id)
+    assert row is not None
+    assert row["name"] == "aroon"
+    assert row["status"] == "created"
+
+
+def test_update_strategy_status(db_client):
+    new_id = strategies_db.add_strategy("aroon", "created", "{}")
+    strategies_db.update_strategy_status(new_id, "active")
+    row = strategies_db.get_strategy_by_id(new_id)
+    assert row["status"] == "active"
@@ -0,0 +1,32 @@
+import pytest
+
+from src.db.queries import strategy_subscriptions as subscriptions_db
+from src.utils.fast_uuid import fast_uuid
+
+pytestmark = pytest.mark.db
+
+
+@pytest.fixture(scope="module")
+def subscription_id(strategy_id, event_manager_id, portfolio_id):
+    # Module scope: no other test file reads subscriptions.
+    return subscriptions_db.add_strategy_subscription(
+        strategy_id, event_manager_id, portfolio_id
+    )
+
+
+def test_get_subscription(subscription_id, strategy_id):
+    row = subscriptions_db.get_strategy_subscription_by_id(subscription_id)
+    assert row is not None
+    assert row["strategy_id"] == strategy_id
+
+
+def test_add_subscription_explicit_id(strategy_id, event_manager_id,
+                                      portfolio_id):
+    explicit_id = fast_uuid()
+    new_id = subscriptions_db.add_strategy_subscription(
+        strategy_id, event_manager_id, portfolio_id,
+        subscription_id=explicit_id,
+    )
+    assert new_id == explicit_id
+    row = subscriptions_db.get_strategy_subscription_by_id(explicit_id)
+    assert row is not None
@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+
+from src.db.queries import event_managers as event_managers_db
+from src.event import Event, EventType, Priority
+from src.event_manager import EventManager
+
+
+class _RecordingEvent(Event):
+    """Event that records its priority into a shared list when processed."""
+
+    __slots__ = ("sink",)
+
+    def __init__(self, priority, sink):
+        super().__init__(EventType.SIGNAL, priority)
+        self.sink = sink
+
+    async def process(self):
+        self.sink.append(self.get_priority().name)
+
+
+@pytest.mark.db
+def test_add_event_manager(_db_bootstrap):
+    async def scenario():
+        manager = EventManager.create_new("test")
+        row = event_managers_db.get_event_manager_by_id(
+            manager.event_manager_id
+        )
+        assert row["status"] == "created"
+        consumer = asyncio.create_task(manager.run())
+        # Event-driven: resumes the moment run() is consuming instead
+        # of sleeping a worst-case interval.
+        await asyncio.wait_for(manager.started.wait(), timeout=5.0)
+        row = event_managers_db.get_event_manager_by_id(
+            manager.event_manager_id
+        )
+        assert row["status"] == "active"
+        manager.stop()
+        await consumer
+        row = event_managers_db.get_event_manager_by_id(
+            manager.event_manager_id
+        )
+        assert row["status"] == "stopped"
+
+    asyncio.run(scenario())
+
+
+def test_event_manager_priority_order():
+    async def scenario():
+        processed = []
+        manager = EventManager()
+        for priority in (Priority.LOW, Priority.MEDIUM, Priority.HIGH,
+                         Priority.MEDIUM):
+            manager.add_event(_RecordingEvent(priority, processed))
+        consumer = asyncio.create_task(manager.run())
+        await asyncio.wait_for(manager.join(), timeout=5.0)
+        manager.stop()
+        await consumer
+        assert processed == ["HIGH", "MEDIUM", "MEDIUM", "LOW"]
+
+    asyncio.run(scenario())
+
+
+def test_event_processing_multiple_events():
+    async def scenario():
+        processed = []
+        manager = EventManager()
+        consumer = asyncio.create_task(manager.run())
+        for _ in range(3):
+            manager.add_event(_RecordingEvent(Priority.MEDIUM, processed))
+        # join() resolves the moment the last event is processed; the
+        # timeout is only the failure bound, not time actually spent.
+        await asyncio.wait_for(manager.join(), timeout=8.0)
+        assert manager._q.empty()
+        assert len(processed) == 3
+        manager.stop()
+        await consumer
+
+    asyncio.run(scenario())
+
+
+def test_multiple_event_managers():
+    async def scenario():
+        first, second = [], []
+        managers = (EventManager(), EventManager())
+        for sink, manager in zip((first, second), managers):
+            for _ in range(5):
+                manager.add_event(_RecordingEvent(Priority.MEDIUM, sink))
+        consumers = [asyncio.create_task(m.run()) for m in managers]
+        await asyncio.wait_for(
+            asyncio.gather(*(m.join() for m in managers)), timeout=5.0
+        )
+        for manager in managers:
+            manager.stop()
+        await asyncio.gather(*consumers)
+        assert len(first) == len(second) == 5
+
+    asyncio.run(scenario())
+
+
+@pytest.fixture(scope="module")
+def running_manager():
+    """One manager and loop shared by the whole num_events sweep.
+
+    Starting and winding down a consumer per parametrization paid the
+    setup three times for identical coverage; the fixture starts run()
+    once and the tests drive the shared loop to drain their own batch.
+    """
+    loop = asyncio.new_event_loop()
+    manager = EventManager()
+
+    async def _start():
+        return asyncio.create_task(manager.run())
+
+    consumer = loop.run_until_complete(_start())
+    yield loop, manager
+    manager.stop()
+    loop.run_until_complete(consumer)
+    loop.close()
+
+
+@pytest.mark.parametrize("num_events", [
+    10,
+    50,
+    pytest.param(100, marks=pytest.mark.slow),
+])
+def test_event_manager_multiple_events(running_manager, num_events):
+    loop, manager = running_manager
+    processed = []
+    manager.add_events([
+        _RecordingEvent(Priority.LOW, processed)
+        for _ in range(num_events)
+    ])
+    loop.run_until_complete(
+        asyncio.wait_for(manager.join(), timeout=10.0)
+    )
+    assert len(processed) == num_events
@@ -0,0 +1,45 @@
+import asyncio
+
+import numpy as np
+
+from src.event import MarketEvent, OrderEvent, SignalEvent
+from src.event_manager import EventManager
+
+_EVENTS_PER_WORKER = 10
+_EVENT_TYPES = (MarketEvent, OrderEvent, SignalEvent)
+
+
+def test_multiple_managers_parallel():
+    """Three managers consume concurrently fed queues to completion."""
+
+    async def scenario():
+        managers = [EventManager() for _ in range(3)]
+        # All randomness is drawn up front from a seeded generator —
+        # reproducible, no per-iteration RNG calls, no module lock —
+        # and events are pre-built so the workers only hand them over.
+        rng = np.random.default_rng(0)
+        picks = rng.integers(0, len(_EVENT_TYPES),
+                             size=(len(managers), _EVENTS_PER_WORKER))
+        batches = [
+            [_EVENT_TYPES[pick]() for pick in row]
+            for row in picks
+        ]
+
+        async def worker(manager, events):
+            # No jitter sleeps: interleaving comes from the event loop,
+            # and the managers drain via join() below.
+            for event in events:
+                await manager.add_event_async(event)
+
+        consumers = [asyncio.create_task(m.run()) for m in managers]
+        await asyncio.gather(*(
+            worker(manager, batch)
+            for manager, batch in zip(managers, batches)
+        ))
+        await asyncio.gather(*(m.join() for m in managers))
+        for manager in managers:
+            manager.stop()
+        await asyncio.gather(*consumers)
+        assert all(m._q.empty() for m in managers)
+
+    asyncio.run(scenario())
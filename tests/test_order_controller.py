@@ -0,0 +1,78 @@
+import pytest
+
+from decimal import Decimal
+
+import orjson
+
+from src.db.db_connection import execute_query
+from src.db.queries import orders as orders_db
+from src.event_sink import get_event_sink
+from src.order_processing.order_controller import order_controller
+
+pytestmark = pytest.mark.db
+
+# Point lookups: the old SELECT * ... ORDER BY created_at scans grew
+# with every row the suite accumulated.
+_COUNT_ORDERS_SQL = "SELECT count() AS n FROM orders"
+_COUNT_EVENTS_SQL = "SELECT count() AS n FROM events"
+_SELECT_CHILDREN_SQL = """
+    SELECT order_id, parent_order_id, order_type, order_side, order_status
+    FROM orders WHERE parent_order_id = %(parent_order_id)s
+"""
+_SELECT_ORDER_EVENTS_SQL = """
+    SELECT payload FROM events
+    WHERE JSONExtractString(payload, 'order_id') = %(order_id)s
+"""
+
+
+def _count(sql):
+    return execute_query(sql)[0]["n"]
+
+
+def test_create_simple_order(live_event_manager_id, seed_portfolio_id,
+                             seed_strategy_id):
+    orders_before = _count(_COUNT_ORDERS_SQL)
+    order_id = order_controller.create_order(
+        live_event_manager_id, seed_portfolio_id, seed_strategy_id,
+        "bybit", "BTC/USDT", "buy", Decimal("50000"), Decimal("0.1"),
+    )
+    get_event_sink().flush()
+    assert _count(_COUNT_ORDERS_SQL) == orders_before + 1
+    row = orders_db.get_order_by_id(order_id)
+    assert row is not None
+    assert row["order_status"] == "awaiting"
+    events = execute_query(_SELECT_ORDER_EVENTS_SQL,
+                           {"order_id": str(order_id)})
+    assert len(events) == 1
+    payload = orjson.loads(events[0]["payload"])
+    assert payload["order_status"] == "awaiting"
+
+
+def test_create_order_with_stop_loss_and_take_profit(
+        live_event_manager_id, seed_portfolio_id, seed_strategy_id):
+    orders_before = _count(_COUNT_ORDERS_SQL)
+    events_before = _count(_COUNT_EVENTS_SQL)
+    order_id = order_controller.create_order(
+        live_event_manager_id, seed_portfolio_id, seed_strategy_id,
+        "bybit", "BTC/USDT", "buy", Decimal("50000"), Decimal("0.1"),
+        stop_loss_price=Decimal("45000"),
+        take_profit_price=Decimal("60000"),
+    )
+    get_event_sink().flush()
+    # The whole set lands in one bulk insert: main + stop-loss +
+    # take-profit, each with its placement event.
+    assert _count(_COUNT_ORDERS_SQL) == orders_before + 3
+    assert _count(_COUNT_EVENTS_SQL) == events_before + 3
+    main = orders_db.get_order_by_id(order_id)
+    assert main["order_type"] == "limit"
+    children = execute_query(_SELECT_CHILDREN_SQL,
+                             {"parent_order_id": order_id})
+    assert {row["order_type"] for row in children} == {
+        "stop_loss", "take_profit",
+    }
+    for child in children:
+        assert child["order_side"] == "sell"
+        events = execute_query(_SELECT_ORDER_EVENTS_SQL,
+                               {"order_id": str(child["order_id"])})
+        assert len(events) == 1
+        assert orjson.loads(events[0]["payload"])["order_status"] == "awaiting"